@@ -7,11 +7,18 @@ and generates fairness reports.
 Uses Claude 3 Haiku via OpenRouter for cost-effective analysis.
 """
 
+import io
+import json
+import re
+
+import numpy as np
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_core.prompts import ChatPromptTemplate
+from openai import OpenAI
 
+from .interviewer import _cacheable, _compile_template, _parse_labeled
 from ..config import get_settings
+from ..http import get_async_http_client
 from ..graph.state import InterviewState, FairnessResult, InterviewScores
 from ..events import log_event
 
@@ -28,24 +35,10 @@ Your role is to:
 You are objective, thorough, and focused on ensuring fair treatment of all candidates."""
 
 
-BIAS_ANALYSIS_PROMPT = """Analyze this interview for potential bias and fairness issues.
-
-Candidate: {candidate_name}
-Problem: {problem_title} ({difficulty})
-
-Interview Transcript:
-{transcript}
-
-Interviewer's Raw Scores:
-- Correctness: {correctness}/10
-- Optimization: {optimization}/10  
-- Communication: {communication}/10
-- Problem Solving: {problem_solving}/10
-
-Additional Context:
-- Hints given: {hints_given}
-- Interview duration: {duration_minutes} minutes
-- Test results: {test_results}
+# Static head of the bias analysis prompt: rubric and output format are
+# identical across interviews, so they sit first and get cache-marked.
+# Only the per-interview transcript/scores tail varies.
+BIAS_ANALYSIS_PROMPT_STATIC = """Analyze this interview for potential bias and fairness issues.
 
 Analyze for:
 1. INAPPROPRIATE QUESTIONS: Were any personal, discriminatory, or off-topic questions asked?
@@ -68,6 +61,36 @@ CONFIDENCE: [0.0-1.0]
 REASONING: [Explain WHY you chose PASS or FAIL. Cite specific evidence from the transcript.]"""
 
 
+BIAS_ANALYSIS_PROMPT_DYNAMIC = """Candidate: {candidate_name}
+Problem: {problem_title} ({difficulty})
+
+Interview Transcript:
+{transcript}
+
+Interviewer's Raw Scores:
+- Correctness: {correctness}/10
+- Optimization: {optimization}/10
+- Communication: {communication}/10
+- Problem Solving: {problem_solving}/10
+
+Additional Context:
+- Hints given: {hints_given}
+- Interview duration: {duration_minutes} minutes
+- Test results: {test_results}"""
+
+
+# Precompiled renderer for the per-interview prompt tail
+_render_bias_tail = _compile_template(BIAS_ANALYSIS_PROMPT_DYNAMIC)
+
+
+# Known response keys, used by the single-pass parser
+BIAS_ANALYSIS_KEYS = frozenset({
+    "BIAS_DETECTED", "FAIRNESS_SCORE", "FLAGS", "SCORE_ADJUSTMENT",
+    "RECOMMENDATION", "CONFIDENCE", "REASONING",
+})
+BIAS_ANALYSIS_MULTILINE = frozenset({"REASONING"})
+
+
 NORMALIZE_HINT_PENALTY = {
     0: 0,      # No hints = no penalty
     1: -0.2,   # 1 hint = small penalty
@@ -75,6 +98,20 @@ NORMALIZE_HINT_PENALTY = {
     3: -0.6,   # 3 hints = larger penalty
 }
 
+# Same penalty schedule as a flat lookup table for the vectorized batch
+# path (index = hints given, saturating at the max penalty for 4+)
+_PENALTY_TABLE = np.array([0.0, -0.2, -0.4, -0.6, -1.0], dtype=np.float32)
+
+# Biased-language markers that force the full LLM audit. Interviews with a
+# clean transcript, few hints, and all tests passing take a rule-based
+# fast path instead of an LLM call.
+BIAS_TRIGGER_RE = re.compile(
+    r"\b(guys|young|old|age|accent|where are you from|cultural fit|"
+    r"background|nationality|married|kids|family|religion|gender|"
+    r"surprisingly|articulate for)\b",
+    re.IGNORECASE,
+)
+
 
 class FairnessAgent:
     """
@@ -90,12 +127,27 @@ class FairnessAgent:
             model=settings.fairness_model,
             api_key=settings.openrouter_api_key,
             base_url=settings.openrouter_base_url,
+            http_async_client=get_async_http_client(),
             temperature=0.3,  # More deterministic for analysis
             max_tokens=1024,
+            # Same prompt-caching opt-in as the interviewer agent.
+            default_headers={"anthropic-beta": "prompt-caching-2024-07-31"},
+        )
+        # Raw client for the Batch API (bulk audits). This cannot share
+        # the OpenRouter credentials: OpenRouter has no /v1/files or
+        # /v1/batches, so batching needs a provider that does, configured
+        # separately. None until batch_api_key is set.
+        self.client = (
+            OpenAI(
+                api_key=settings.batch_api_key,
+                base_url=settings.batch_base_url,
+            )
+            if settings.batch_api_key
+            else None
         )
         self.settings = settings
     
-    def analyze_interview(self, state: InterviewState) -> FairnessResult:
+    async def analyze_interview(self, state: InterviewState) -> FairnessResult:
         """
         Perform complete fairness analysis on a finished interview.
         
@@ -119,20 +171,176 @@ class FairnessAgent:
                 confidence=1.0
             )
         
-        # Get raw scores
+        # Rule-based fast path: clean transcript, at most one hint, and all
+        # tests passing means there is nothing for the auditor to weigh --
+        # skip the LLM call and apply the rubric directly. Any bias-trigger
+        # match or ambiguous outcome falls through to the full analysis.
+        submissions = state.get("code_submissions", [])
+        last_result = submissions[-1].get("test_results", {}) if submissions else {}
+        all_passed = last_result.get("passed", 0) == last_result.get("total", 1)
+        if (
+            not BIAS_TRIGGER_RE.search(transcript)
+            and state.get("hints_given", 0) <= 1
+            and all_passed
+        ):
+            result = FairnessResult(
+                bias_detected=False,
+                fairness_score=9.0,
+                flags=[],
+                normalized_scores=self._normalize_scores(
+                    state.get("raw_scores") or {
+                        "correctness": 5,
+                        "optimization": 5,
+                        "communication": 5,
+                        "problem_solving": 5,
+                    },
+                    state.get("hints_given", 0),
+                ),
+                recommendation="PASS",
+                confidence=0.6,
+                reasoning="Fast path: no bias triggers detected, minimal hints, all tests passed.",
+            )
+            log_event(
+                "AGENT_RESPONSE",
+                state["session_id"],
+                {"agent": "fairness", "result": {"fast_path": True, **{
+                    "bias_detected": False,
+                    "fairness_score": 9.0,
+                    "recommendation": "PASS",
+                }}}
+            )
+            return result
+
+        # Run bias analysis: system prompt + rubric are cache-marked,
+        # only the transcript/scores tail is sent uncached.
+        messages = [
+            SystemMessage(content=_cacheable(FAIRNESS_SYSTEM_PROMPT)),
+            HumanMessage(content=_cacheable(BIAS_ANALYSIS_PROMPT_STATIC) + [{
+                "type": "text",
+                "text": self._dynamic_prompt(state, transcript),
+            }])
+        ]
+
+        response = await self.llm.ainvoke(messages)
+
+        return self._result_from_content(state, response.content)
+
+    def submit_batch(self, states: list[InterviewState]) -> str:
+        """
+        Submit a bulk fairness audit via the Batch API.
+
+        Packs one bias-analysis request per interview into a single JSONL
+        batch job (24h completion window). Much cheaper than the live
+        endpoint for nightly rescoring / fleet-wide re-audits.
+
+        Returns:
+            The batch job ID for later polling.
+
+        Raises:
+            RuntimeError: if no Batch API provider is configured.
+        """
+        if self.client is None:
+            raise RuntimeError(
+                "Batch API not configured: set BATCH_API_KEY (and optionally "
+                "BATCH_BASE_URL / BATCH_MODEL) to a Batch-capable provider"
+            )
+        lines = []
+        for state in states:
+            transcript = self._build_transcript(state)
+            lines.append(json.dumps({
+                "custom_id": state["session_id"],
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.settings.batch_model,
+                    "temperature": 0.3,
+                    "max_tokens": 1024,
+                    "messages": [
+                        {"role": "system", "content": FAIRNESS_SYSTEM_PROMPT},
+                        {"role": "user", "content": (
+                            BIAS_ANALYSIS_PROMPT_STATIC + "\n\n"
+                            + self._dynamic_prompt(state, transcript)
+                        )},
+                    ],
+                },
+            }))
+
+        batch_file = self.client.files.create(
+            file=io.BytesIO("\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        log_event(
+            "AGENT_RESPONSE",
+            "batch",
+            {"agent": "fairness", "batch_id": batch.id, "num_interviews": len(states)}
+        )
+
+        return batch.id
+
+    def poll_batch(
+        self,
+        batch_id: str,
+        states: dict[str, InterviewState],
+    ) -> dict[str, FairnessResult] | None:
+        """
+        Poll a batch job and parse completed results.
+
+        Args:
+            batch_id: Job ID returned by submit_batch
+            states: session_id -> state mapping for score normalization
+
+        Returns:
+            session_id -> FairnessResult mapping, or None if still running
+
+        Raises:
+            RuntimeError: if no Batch API provider is configured.
+        """
+        if self.client is None:
+            raise RuntimeError(
+                "Batch API not configured: set BATCH_API_KEY (and optionally "
+                "BATCH_BASE_URL / BATCH_MODEL) to a Batch-capable provider"
+            )
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            return None
+
+        output = self.client.files.content(batch.output_file_id)
+        results: dict[str, FairnessResult] = {}
+
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            session_id = entry["custom_id"]
+            state = states.get(session_id)
+            if state is None:
+                continue
+            content = entry["response"]["body"]["choices"][0]["message"]["content"]
+            results[session_id] = self._result_from_content(state, content)
+
+        return results
+
+    def _dynamic_prompt(self, state: InterviewState, transcript: str) -> str:
+        """Format the per-interview tail of the bias analysis prompt."""
         raw_scores = state.get("raw_scores") or {
             "correctness": 5,
             "optimization": 5,
             "communication": 5,
             "problem_solving": 5,
         }
-        
+
         # Calculate duration
         from datetime import datetime
         started = datetime.fromisoformat(state["started_at"])
         ended = datetime.fromisoformat(state.get("ended_at") or datetime.now().isoformat())
         duration = (ended - started).total_seconds() / 60
-        
+
         # Get test results summary
         submissions = state.get("code_submissions", [])
         if submissions:
@@ -140,35 +348,38 @@ class FairnessAgent:
             test_summary = f"Passed {last_result.get('passed', 0)}/{last_result.get('total', 0)} tests"
         else:
             test_summary = "No code submitted"
-        
-        # Run bias analysis
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content=FAIRNESS_SYSTEM_PROMPT),
-            HumanMessage(content=BIAS_ANALYSIS_PROMPT.format(
-                candidate_name=state.get("candidate_name", "Unknown"),
-                problem_title=state["problem"]["title"],
-                difficulty=state["problem"]["difficulty"],
-                transcript=transcript,
-                correctness=raw_scores.get("correctness", 5),
-                optimization=raw_scores.get("optimization", 5),
-                communication=raw_scores.get("communication", 5),
-                problem_solving=raw_scores.get("problem_solving", 5),
-                hints_given=state.get("hints_given", 0),
-                duration_minutes=int(duration),
-                test_results=test_summary,
-            ))
-        ])
-        
-        response = self.llm.invoke(prompt.format_messages())
-        content = response.content
-        
-        # Parse response
-        bias_detected = self._parse_bool(content, "BIAS_DETECTED")
-        fairness_score = self._parse_float(content, "FAIRNESS_SCORE", 8.0)
-        flags = self._parse_list(content, "FLAGS")
-        recommendation = self._parse_string(content, "RECOMMENDATION", "LEAN NO HIRE")
-        confidence = self._parse_float(content, "CONFIDENCE", 0.7)
-        reasoning = self._parse_string(content, "REASONING", "No reasoning provided")
+
+        return _render_bias_tail(
+            candidate_name=state.get("candidate_name", "Unknown"),
+            problem_title=state["problem"]["title"],
+            difficulty=state["problem"]["difficulty"],
+            transcript=transcript,
+            correctness=raw_scores.get("correctness", 5),
+            optimization=raw_scores.get("optimization", 5),
+            communication=raw_scores.get("communication", 5),
+            problem_solving=raw_scores.get("problem_solving", 5),
+            hints_given=state.get("hints_given", 0),
+            duration_minutes=int(duration),
+            test_results=test_summary,
+        )
+
+    def _result_from_content(self, state: InterviewState, content: str) -> FairnessResult:
+        """Parse an LLM bias-analysis response into a FairnessResult."""
+        raw_scores = state.get("raw_scores") or {
+            "correctness": 5,
+            "optimization": 5,
+            "communication": 5,
+            "problem_solving": 5,
+        }
+
+        # Parse response in a single pass
+        fields = _parse_labeled(content, BIAS_ANALYSIS_KEYS, BIAS_ANALYSIS_MULTILINE)
+        bias_detected = fields.get("BIAS_DETECTED", "").lower() == "true"
+        fairness_score = self._parse_float(fields, "FAIRNESS_SCORE", 8.0)
+        flags = self._parse_list(fields, "FLAGS")
+        recommendation = fields.get("RECOMMENDATION") or "LEAN NO HIRE"
+        confidence = self._parse_float(fields, "CONFIDENCE", 0.7)
+        reasoning = fields.get("REASONING") or "No reasoning provided"
         
         # Normalize scores based on hints
         normalized_scores = self._normalize_scores(
@@ -205,19 +416,29 @@ class FairnessAgent:
         return result
     
     def _build_transcript(self, state: InterviewState) -> str:
-        """Build readable transcript from conversation history."""
-        messages = state.get("conversation_history", [])
-        if not messages:
-            return "(No conversation recorded)"
-        
-        lines = []
-        for msg in messages:
-            role = msg["role"].upper()
-            content = msg["content"]
-            lines.append(f"{role}: {content}")
-        
-        return "\n".join(lines)
+        """Get the rolling transcript maintained alongside conversation_history."""
+        return state.get("transcript_text", "").strip() or "(No conversation recorded)"
     
+    def normalize_batch(self, raw_scores: np.ndarray, hints: np.ndarray) -> np.ndarray:
+        """
+        Vectorized score normalization for bulk re-audits.
+
+        Applies the same hint penalty as _normalize_scores across many
+        interviews at once instead of looping per row.
+
+        Args:
+            raw_scores: (N, 4) array of correctness/optimization/
+                communication/problem_solving scores
+            hints: (N,) array of hints given per interview
+
+        Returns:
+            (N, 4) array of clamped integer scores
+        """
+        penalty = _PENALTY_TABLE[np.minimum(hints, len(_PENALTY_TABLE) - 1)]
+        normalized = raw_scores.astype(np.float32)
+        normalized[:, 3] = normalized[:, 3] + penalty * 10
+        return np.clip(normalized, 0, 10).astype(np.int8)
+
     def _normalize_scores(
         self, 
         raw_scores: dict, 
@@ -240,45 +461,19 @@ class FairnessAgent:
         
         return InterviewScores(**normalized)
     
-    def _parse_bool(self, content: str, key: str) -> bool:
-        """Parse boolean value from response."""
-        for line in content.split("\n"):
-            if line.strip().upper().startswith(key.upper() + ":"):
-                value = line.split(":", 1)[1].strip().lower()
-                return value == "true"
-        return False
-    
-    def _parse_float(self, content: str, key: str, default: float) -> float:
-        """Parse float value from response."""
-        for line in content.split("\n"):
-            if line.strip().upper().startswith(key.upper() + ":"):
-                try:
-                    value = line.split(":", 1)[1].strip()
-                    return float(value.split()[0])
-                except (ValueError, IndexError):
-                    pass
-        return default
-    
-    def _parse_string(self, content: str, key: str, default: str) -> str:
-        """Parse string value from response. For REASONING, captures all remaining content."""
-        lines = content.split("\n")
-        for i, line in enumerate(lines):
-            if line.strip().upper().startswith(key.upper() + ":"):
-                # Get value on same line
-                value = line.split(":", 1)[1].strip()
-                # If key is REASONING, also capture subsequent lines until end
-                if key.upper() == "REASONING":
-                    remaining = lines[i+1:]
-                    value = value + " " + " ".join(l.strip() for l in remaining if l.strip())
-                return value
+    def _parse_float(self, fields: dict[str, str], key: str, default: float) -> float:
+        """Parse float value from the parsed response."""
+        value = fields.get(key)
+        if value:
+            try:
+                return float(value.split()[0])
+            except ValueError:
+                pass
         return default
-    
-    def _parse_list(self, content: str, key: str) -> list[str]:
-        """Parse comma-separated list from response."""
-        for line in content.split("\n"):
-            if line.strip().upper().startswith(key.upper() + ":"):
-                value = line.split(":", 1)[1].strip()
-                if value.lower() == "none":
-                    return []
-                return [item.strip() for item in value.split(",") if item.strip()]
-        return []
+
+    def _parse_list(self, fields: dict[str, str], key: str) -> list[str]:
+        """Parse comma-separated list from the parsed response."""
+        value = fields.get(key, "")
+        if not value or value.lower() == "none":
+            return []
+        return [item.strip() for item in value.split(",") if item.strip()]
@@ -7,14 +7,23 @@ provides contextual hints, and scores solutions.
 Uses Claude 3.5 Sonnet via OpenRouter.
 """
 
+import hashlib
+import string
+import time
 from datetime import datetime
-from typing import Literal
+from typing import Callable, Literal
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
-from langchain_core.prompts import ChatPromptTemplate
 
 from ..config import get_settings
-from ..graph.state import InterviewState, ConversationMessage, InterviewScores
+from ..http import get_async_http_client
+from ..graph.state import (
+    InterviewState,
+    ConversationMessage,
+    FairnessResult,
+    InterviewScores,
+    ProblemInfo,
+)
 from ..events import log_event, EventType
 
 
@@ -22,6 +31,13 @@ from ..events import log_event, EventType
 AnalysisAction = Literal["IGNORE", "HINT", "ENCOURAGE", "PROMPT"]
 
 
+# Memo for repeated identical snapshots (undo/redo, paste-backs): short TTL
+# so a stale verdict can't outlive the "stuck" window, bounded size so a
+# long-running worker doesn't grow without limit.
+ANALYSIS_CACHE_TTL_SECONDS = 30.0
+ANALYSIS_CACHE_MAX_ENTRIES = 2048
+
+
 INTERVIEWER_SYSTEM_PROMPT = """You are Sarah, an experienced technical interviewer at a top tech company. 
 You're conducting a live coding interview for a software engineering position.
 
@@ -47,11 +63,31 @@ Remember: You're NOT a linter. Ignore syntax typos - let them fix those.
 Focus on algorithmic and logical issues."""
 
 
-ANALYSIS_PROMPT = """Analyze this code change and decide your next action.
+# Static head of the analysis prompt: fixed per problem, so it can be served
+# from the provider's prompt cache (placed first, before the per-call tail).
+ANALYSIS_PROMPT_STATIC = """Analyze this code change and decide your next action.
 
 Problem: {problem_title}
 Expected approach: {optimal_approach}
 
+Analyze the code and respond with ONE of these actions:
+1. IGNORE - Minor change, typo fix, or candidate is making good progress. Say nothing.
+2. HINT - Logical error detected that will lead to wrong answer. Provide a subtle hint.
+3. ENCOURAGE - Good approach detected! Give brief encouragement.
+4. PROMPT - Candidate seems stuck (2+ min no meaningful progress). Offer help.
+
+Respond in this exact format:
+ACTION: [IGNORE|HINT|ENCOURAGE|PROMPT]
+REASONING: [Your internal reasoning - not shown to candidate]
+MESSAGE: [What you'll say to candidate, or empty if IGNORE]"""
+
+
+# Cheap first-pass screen: a draft model answers YES/NO on whether any
+# intervention might be needed before the full analysis model is invoked.
+TRIAGE_PROMPT = """You are screening code changes during a live coding interview.
+Decide whether the interviewer might need to respond to this change
+(hint for a logical error, encouragement, or a nudge for being stuck).
+
 Previous code:
 ```python
 {previous_code}
@@ -63,18 +99,96 @@ Current code:
 ```
 
 Time since last change: {time_since_change} seconds
-Hints already given: {hints_given}
 
-Analyze the code and respond with ONE of these actions:
-1. IGNORE - Minor change, typo fix, or candidate is making good progress. Say nothing.
-2. HINT - Logical error detected that will lead to wrong answer. Provide a subtle hint.
-3. ENCOURAGE - Good approach detected! Give brief encouragement.
-4. PROMPT - Candidate seems stuck (2+ min no meaningful progress). Offer help.
+Respond with exactly one word:
+YES - the interviewer might need to respond
+NO - minor change, typo fix, or normal progress"""
 
-Respond in this exact format:
-ACTION: [IGNORE|HINT|ENCOURAGE|PROMPT]
-REASONING: [Your internal reasoning - not shown to candidate]
-MESSAGE: [What you'll say to candidate, or empty if IGNORE]"""
+
+# Dynamic tail: changes on every code snapshot, so it stays uncached.
+ANALYSIS_PROMPT_DYNAMIC = """Previous code:
+```python
+{previous_code}
+```
+
+Current code:
+```python
+{current_code}
+```
+
+Time since last change: {time_since_change} seconds
+Hints already given: {hints_given}"""
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Pre-tokenize a format template into literal segments and field names.
+
+    str.format re-parses the format mini-language on every call; the
+    returned renderer just interleaves the precomputed literals with
+    str()-converted values and joins once. Used for the templates that
+    are formatted on every LLM call.
+    """
+    parts = [
+        (literal, field)
+        for literal, field, _, _ in string.Formatter().parse(template)
+    ]
+
+    def render(**values) -> str:
+        out = []
+        for literal, field in parts:
+            if literal:
+                out.append(literal)
+            if field is not None:
+                out.append(str(values[field]))
+        return "".join(out)
+
+    return render
+
+
+def _cacheable(text: str) -> list[dict]:
+    """Wrap prompt text in a content block marked for provider-side caching."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+# Known response keys per prompt, used by the single-pass parser
+ANALYSIS_KEYS = frozenset({"ACTION", "REASONING", "MESSAGE"})
+ANALYSIS_MULTILINE = frozenset({"MESSAGE"})
+SCORING_KEYS = frozenset({
+    "CORRECTNESS", "OPTIMIZATION", "COMMUNICATION", "PROBLEM_SOLVING", "NOTES",
+})
+SCORING_MULTILINE = frozenset({"NOTES"})
+
+
+def _parse_labeled(
+    content: str,
+    keys: frozenset[str],
+    multiline: frozenset[str] = frozenset(),
+) -> dict[str, str]:
+    """
+    Parse a "KEY: value" formatted LLM response in a single pass.
+
+    Splits once and walks each line once, instead of one full scan per
+    field. Keys in `multiline` accumulate continuation lines until the
+    next known key appears.
+    """
+    parts: dict[str, list[str]] = {}
+    current: str | None = None
+
+    for line in content.split("\n"):
+        head, sep, val = line.partition(":")
+        if sep:
+            key = head.strip().upper()
+            if key in keys:
+                parts[key] = [val.strip()]
+                current = key if key in multiline else None
+                continue
+        if current is not None:
+            stripped = line.strip()
+            if stripped:
+                parts[current].append(stripped)
+
+    return {key: " ".join(vals).strip() for key, vals in parts.items()}
 
 
 SCORING_PROMPT = """Score this interview based on the candidate's final code and conversation.
@@ -110,6 +224,67 @@ PROBLEM_SOLVING: [0-10]
 NOTES: [Brief interviewer notes about the candidate's performance]"""
 
 
+# Fused end-of-interview pass: one call emits both the scoring fields and
+# the fairness-audit fields over the shared transcript, instead of two
+# sequential roundtrips that each re-send the same context.
+COMBINED_SCORING_FAIRNESS_PROMPT = """Score this interview AND audit it for fairness, based on the candidate's final code and conversation.
+
+Candidate: {candidate_name}
+Problem: {problem_title} ({difficulty})
+Optimal approach: {optimal_approach}
+
+Final submitted code:
+```python
+{final_code}
+```
+
+Test results: {test_results}
+
+Conversation transcript:
+{transcript}
+
+Number of hints given: {hints_given}
+Interview duration: {duration_minutes} minutes
+
+PART 1 - Score each dimension from 0-10:
+1. CORRECTNESS (0-10): Does the solution work? Pass all test cases?
+2. OPTIMIZATION (0-10): Time/space complexity. Did they achieve optimal solution?
+3. COMMUNICATION (0-10): Did they explain their approach? Think aloud?
+4. PROBLEM_SOLVING (0-10): How was their problem-solving process? Did they need many hints?
+
+PART 2 - Audit the interview for:
+1. INAPPROPRIATE QUESTIONS: Were any personal, discriminatory, or off-topic questions asked?
+2. HINT DISTRIBUTION: Were hints given fairly, or withheld/overdone?
+3. TONE CONSISTENCY: Was the interviewer's tone professional throughout?
+4. SCORING FAIRNESS: Do the scores match the actual performance evidence?
+5. MICROAGGRESSIONS: Any subtle biased language or assumptions?
+
+RECOMMENDATION CRITERIA (VERY HIGH BAR):
+- PASS: Candidate MUST have correctly solved the problem with working code AND clearly explained their approach. Partial success is NOT enough.
+- FAIL: Anything mediocre, confused, incomplete, or requiring hand-holding. When in doubt, FAIL.
+
+Respond in this exact format:
+CORRECTNESS: [0-10]
+OPTIMIZATION: [0-10]
+COMMUNICATION: [0-10]
+PROBLEM_SOLVING: [0-10]
+NOTES: [Brief interviewer notes about the candidate's performance]
+BIAS_DETECTED: [true|false]
+FAIRNESS_SCORE: [0.0-10.0]
+FLAGS: [comma-separated list of issues, or "none"]
+SCORE_ADJUSTMENT: [If scores need adjustment, explain. Otherwise "none needed"]
+RECOMMENDATION: [PASS|FAIL]
+CONFIDENCE: [0.0-1.0]
+REASONING: [Explain WHY you chose PASS or FAIL. Cite specific evidence from the transcript.]"""
+
+
+# Precompiled renderers for the templates formatted on every call
+_render_triage = _compile_template(TRIAGE_PROMPT)
+_render_analysis_tail = _compile_template(ANALYSIS_PROMPT_DYNAMIC)
+_render_scoring = _compile_template(SCORING_PROMPT)
+_render_combined = _compile_template(COMBINED_SCORING_FAIRNESS_PROMPT)
+
+
 class InterviewerAgent:
     """
     Agent 1: Technical Interviewer
@@ -124,31 +299,83 @@ class InterviewerAgent:
             model=settings.interviewer_model,
             api_key=settings.openrouter_api_key,
             base_url=settings.openrouter_base_url,
+            http_async_client=get_async_http_client(),
             temperature=0.7,  # Some personality variation
             max_tokens=1024,
+            # OpenRouter forwards this to Anthropic so cache_control blocks
+            # are honored; static prompt prefixes then skip full input billing.
+            default_headers={"anthropic-beta": "prompt-caching-2024-07-31"},
+        )
+        # Analysis responses are short and structured (~150 tokens max), so
+        # analyze_code gets its own client with a much lower ceiling; the
+        # 1024-token self.llm stays for presentation and scoring.
+        self.llm_analyze = ChatOpenAI(
+            model=settings.interviewer_model,
+            api_key=settings.openrouter_api_key,
+            base_url=settings.openrouter_base_url,
+            http_async_client=get_async_http_client(),
+            temperature=0.7,
+            max_tokens=200,
+            default_headers={"anthropic-beta": "prompt-caching-2024-07-31"},
+        )
+        # Draft model for the YES/NO triage screen -- same cheap model the
+        # fairness agent uses, ~10x cheaper/faster than the full analyzer.
+        self.draft_llm = ChatOpenAI(
+            model=settings.fairness_model,
+            api_key=settings.openrouter_api_key,
+            base_url=settings.openrouter_base_url,
+            http_async_client=get_async_http_client(),
+            temperature=0.0,
+            max_tokens=5,
         )
         self.settings = settings
+        # Problem metadata is immutable per problem ID, so the formatted
+        # system message and analysis-prompt head are built once and reused
+        # across every code snapshot instead of re-formatting per call.
+        self._system_messages: dict[str, SystemMessage] = {}
+        self._analysis_heads: dict[str, list[dict]] = {}
+        # (expiry, result) per snapshot hash; see analyze_code
+        self._analysis_cache: dict[str, tuple[float, tuple[AnalysisAction, str | None]]] = {}
+
+    def _system_message(self, problem: ProblemInfo) -> SystemMessage:
+        """Get the cached per-problem system message."""
+        message = self._system_messages.get(problem["id"])
+        if message is None:
+            message = SystemMessage(content=_cacheable(INTERVIEWER_SYSTEM_PROMPT.format(
+                problem_title=problem["title"],
+                difficulty=problem["difficulty"],
+                optimal_approach=problem["optimal_approach"],
+            )))
+            self._system_messages[problem["id"]] = message
+        return message
+
+    def _analysis_head(self, problem: ProblemInfo) -> list[dict]:
+        """Get the cached per-problem static head of the analysis prompt."""
+        head = self._analysis_heads.get(problem["id"])
+        if head is None:
+            head = _cacheable(ANALYSIS_PROMPT_STATIC.format(
+                problem_title=problem["title"],
+                optimal_approach=problem["optimal_approach"],
+            ))
+            self._analysis_heads[problem["id"]] = head
+        return head
     
-    def present_problem(self, state: InterviewState) -> str:
+    async def present_problem(self, state: InterviewState) -> str:
         """Generate initial problem presentation speech."""
         problem = state["problem"]
         
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content=INTERVIEWER_SYSTEM_PROMPT.format(
-                problem_title=problem["title"],
-                difficulty=problem["difficulty"],
-                optimal_approach=problem["optimal_approach"],
-            )),
+        messages = [
+            self._system_message(problem),
             HumanMessage(content=f"""Present this problem to the candidate in a friendly, conversational way.
-            
+
 Problem: {problem['title']}
 Prompt: {problem['prompt']}
 Constraints: {', '.join(problem['constraints'])}
 
 Keep it under 3 sentences. Don't reveal the optimal solution approach.""")
-        ])
-        
-        response = self.llm.invoke(prompt.format_messages())
+        ]
+
+        response = await self.llm.ainvoke(messages)
         message = response.content
         
         # Log event
@@ -160,8 +387,8 @@ Keep it under 3 sentences. Don't reveal the optimal solution approach.""")
         
         return message
     
-    def analyze_code(
-        self, 
+    async def analyze_code(
+        self,
         state: InterviewState,
         new_code: str,
     ) -> tuple[AnalysisAction, str | None]:
@@ -180,29 +407,68 @@ Keep it under 3 sentences. Don't reveal the optimal solution approach.""")
             time_delta = (datetime.now() - last_change).total_seconds()
         else:
             time_delta = 0
-        
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content=INTERVIEWER_SYSTEM_PROMPT.format(
-                problem_title=problem["title"],
-                difficulty=problem["difficulty"],
-                optimal_approach=problem["optimal_approach"],
-            )),
-            HumanMessage(content=ANALYSIS_PROMPT.format(
-                problem_title=problem["title"],
-                optimal_approach=problem["optimal_approach"],
+
+        # Memo hit: an identical (problem, diff, hints) snapshot within the
+        # TTL -- typically an undo/redo or paste-back -- skips the LLM
+        # roundtrips entirely.
+        cache_key = hashlib.sha1(
+            f"{problem['id']}|{previous_code}|{new_code}|{state.get('hints_given', 0)}".encode()
+        ).hexdigest()
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # Model cascade: the draft model first screens whether intervention
+        # might be warranted at all. ~90% of snapshots are IGNORE, so the
+        # common case never reaches the full analysis model.
+        triage = await self.draft_llm.ainvoke([
+            HumanMessage(content=_render_triage(
                 previous_code=previous_code,
                 current_code=new_code,
                 time_since_change=int(time_delta),
-                hints_given=state.get("hints_given", 0),
             ))
         ])
-        
-        response = self.llm.invoke(prompt.format_messages())
-        content = response.content
-        
-        # Parse response
-        action = self._parse_action(content)
-        message = self._parse_message(content) if action != "IGNORE" else None
+        if triage.content.strip().upper().startswith("NO"):
+            self._cache_analysis(cache_key, ("IGNORE", None))
+            return "IGNORE", None
+
+        # Static content (system prompt, problem metadata, instructions) goes
+        # first and is cache-marked; only the code-diff tail varies per call.
+        messages = [
+            self._system_message(problem),
+            HumanMessage(content=self._analysis_head(problem) + [{"type": "text", "text": _render_analysis_tail(
+                previous_code=previous_code,
+                current_code=new_code,
+                time_since_change=int(time_delta),
+                hints_given=state.get("hints_given", 0),
+            )}])
+        ]
+
+        # Stream the response and abort as soon as the first line decodes to
+        # ACTION: IGNORE (the common case for minor edits) -- skips waiting
+        # for the model to generate the REASONING/MESSAGE tail.
+        # The blank-line stop sequence ends generation server-side once the
+        # three response fields are emitted, instead of letting the model
+        # ramble up to the token ceiling.
+        chunks: list[str] = []
+        first_line_checked = False
+        stream = self.llm_analyze.astream(messages, stop=["\n\n"])
+        async for chunk in stream:
+            chunks.append(chunk.content)
+            if not first_line_checked and "\n" in chunk.content:
+                first_line = "".join(chunks).split("\n", 1)[0]
+                first_line_checked = True
+                if first_line.strip() == "ACTION: IGNORE":
+                    await stream.aclose()
+                    self._cache_analysis(cache_key, ("IGNORE", None))
+                    return "IGNORE", None
+
+        content = "".join(chunks)
+
+        # Parse response in a single pass
+        fields = _parse_labeled(content, ANALYSIS_KEYS, ANALYSIS_MULTILINE)
+        action = self._parse_action(fields)
+        message = fields.get("MESSAGE", "") if action != "IGNORE" else None
         
         # Log appropriate event
         if action == "HINT":
@@ -223,10 +489,30 @@ Keep it under 3 sentences. Don't reveal the optimal solution approach.""")
                 state["session_id"],
                 {"message": message, "reason": "stuck"}
             )
-        
+
+        # Only idempotent verdicts are memoized; HINT/PROMPT are never
+        # cached so a re-ask cannot repeat the same hint verbatim.
+        if action in ("IGNORE", "ENCOURAGE"):
+            self._cache_analysis(cache_key, (action, message))
+
         return action, message
+
+    def _cache_analysis(
+        self,
+        key: str,
+        result: tuple[AnalysisAction, str | None],
+    ) -> None:
+        """Store an analysis verdict with TTL, evicting stale entries when full."""
+        cache = self._analysis_cache
+        if len(cache) >= ANALYSIS_CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            for stale in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+                del cache[stale]
+            while len(cache) >= ANALYSIS_CACHE_MAX_ENTRIES:
+                cache.pop(next(iter(cache)))  # Oldest insertion first
+        cache[key] = (time.monotonic() + ANALYSIS_CACHE_TTL_SECONDS, result)
     
-    def score_solution(
+    async def score_solution(
         self,
         state: InterviewState,
         test_results: dict,
@@ -239,19 +525,16 @@ Keep it under 3 sentences. Don't reveal the optimal solution approach.""")
         """
         problem = state["problem"]
         
-        # Build transcript
-        transcript = "\n".join([
-            f"{msg['role'].upper()}: {msg['content']}"
-            for msg in state.get("conversation_history", [])
-        ])
-        
+        # Rolling transcript, maintained alongside conversation_history
+        transcript = state.get("transcript_text", "").strip()
+
         # Calculate duration
         started = datetime.fromisoformat(state["started_at"])
         duration = (datetime.now() - started).total_seconds() / 60
         
-        prompt = ChatPromptTemplate.from_messages([
+        messages = [
             SystemMessage(content="You are a fair and thorough technical interviewer scoring a candidate."),
-            HumanMessage(content=SCORING_PROMPT.format(
+            HumanMessage(content=_render_scoring(
                 problem_title=problem["title"],
                 difficulty=problem["difficulty"],
                 optimal_approach=problem["optimal_approach"],
@@ -261,14 +544,15 @@ Keep it under 3 sentences. Don't reveal the optimal solution approach.""")
                 hints_given=state.get("hints_given", 0),
                 duration_minutes=int(duration),
             ))
-        ])
-        
-        response = self.llm.invoke(prompt.format_messages())
+        ]
+
+        response = await self.llm.ainvoke(messages)
         content = response.content
         
-        # Parse scores
-        scores = self._parse_scores(content)
-        notes = self._parse_notes(content)
+        # Parse scores in a single pass
+        fields = _parse_labeled(content, SCORING_KEYS, SCORING_MULTILINE)
+        scores = self._parse_scores(fields)
+        notes = fields.get("NOTES") or "No additional notes."
         
         # Log final verdict
         log_event(
@@ -283,59 +567,104 @@ Keep it under 3 sentences. Don't reveal the optimal solution approach.""")
         
         return InterviewScores(**scores), notes
     
-    def _parse_action(self, content: str) -> AnalysisAction:
-        """Extract action from LLM response."""
-        for line in content.split("\n"):
-            if line.startswith("ACTION:"):
-                action = line.replace("ACTION:", "").strip()
-                if action in ("IGNORE", "HINT", "ENCOURAGE", "PROMPT"):
-                    return action
+    async def score_and_audit(
+        self,
+        state: InterviewState,
+        test_results: dict,
+    ) -> tuple[InterviewScores, str, FairnessResult]:
+        """
+        Score the solution and run the fairness audit in one LLM call.
+
+        Fuses score_solution and FairnessAgent.analyze_interview: both
+        consume the same transcript/code/problem context, so one roundtrip
+        emits all fields and the shared context is tokenized once. The
+        separate methods stay available for debugging either half alone.
+
+        Returns:
+            Tuple of (scores dict, interviewer notes, fairness result)
+        """
+        # Deferred: fairness.py imports this module at load time
+        from .fairness import BIAS_ANALYSIS_KEYS, BIAS_ANALYSIS_MULTILINE
+        from ..graph.orchestrator import get_fairness_agent
+
+        problem = state["problem"]
+        transcript = state.get("transcript_text", "").strip()
+
+        started = datetime.fromisoformat(state["started_at"])
+        duration = (datetime.now() - started).total_seconds() / 60
+
+        messages = [
+            SystemMessage(content=_cacheable(
+                "You are a fair and thorough technical interviewer scoring a candidate, "
+                "and simultaneously an AI fairness auditor reviewing the interview for bias."
+            )),
+            HumanMessage(content=_render_combined(
+                candidate_name=state.get("candidate_name", "Unknown"),
+                problem_title=problem["title"],
+                difficulty=problem["difficulty"],
+                optimal_approach=problem["optimal_approach"],
+                final_code=state["code_snapshot"],
+                test_results=str(test_results),
+                transcript=transcript or "(No conversation recorded)",
+                hints_given=state.get("hints_given", 0),
+                duration_minutes=int(duration),
+            ))
+        ]
+
+        response = await self.llm.ainvoke(messages)
+        content = response.content
+
+        # Run the scoring and fairness parsers over the same response;
+        # both halves' multiline fields (NOTES, REASONING) must be in the
+        # multiline set or they get truncated to their first line
+        fields = _parse_labeled(
+            content,
+            SCORING_KEYS | BIAS_ANALYSIS_KEYS,
+            SCORING_MULTILINE | BIAS_ANALYSIS_MULTILINE,
+        )
+        scores = self._parse_scores(fields)
+        notes = fields.get("NOTES") or "No additional notes."
+
+        log_event(
+            "FINAL_VERDICT",
+            state["session_id"],
+            {
+                "scores": scores,
+                "notes": notes,
+                "duration_minutes": int(duration),
+            }
+        )
+
+        # The fairness half normalizes against the scores just produced
+        fairness_result = get_fairness_agent()._result_from_content(
+            {**state, "raw_scores": scores},
+            content,
+        )
+
+        return InterviewScores(**scores), notes, fairness_result
+
+    def _parse_action(self, fields: dict[str, str]) -> AnalysisAction:
+        """Validate the action field from the parsed response."""
+        action = fields.get("ACTION", "")
+        if action in ("IGNORE", "HINT", "ENCOURAGE", "PROMPT"):
+            return action
         return "IGNORE"  # Default to ignore if parsing fails
-    
-    def _parse_message(self, content: str) -> str:
-        """Extract message from LLM response."""
-        lines = content.split("\n")
-        for i, line in enumerate(lines):
-            if line.startswith("MESSAGE:"):
-                # Get everything after MESSAGE: on this and following lines
-                message = line.replace("MESSAGE:", "").strip()
-                # Include continuation lines
-                for j in range(i + 1, len(lines)):
-                    if not any(lines[j].startswith(k) for k in ["ACTION:", "REASONING:"]):
-                        message += " " + lines[j].strip()
-                    else:
-                        break
-                return message.strip()
-        return ""
-    
-    def _parse_scores(self, content: str) -> dict[str, int]:
-        """Extract scores from LLM response."""
+
+    def _parse_scores(self, fields: dict[str, str]) -> dict[str, int]:
+        """Extract clamped 0-10 scores from the parsed response."""
         scores = {
             "correctness": 5,
             "optimization": 5,
             "communication": 5,
             "problem_solving": 5,
         }
-        
-        for line in content.split("\n"):
-            line = line.strip()
-            for key in scores:
-                if line.upper().startswith(key.upper() + ":"):
-                    try:
-                        value = int(line.split(":")[1].strip().split()[0])
-                        scores[key] = max(0, min(10, value))
-                    except (ValueError, IndexError):
-                        pass
-        
+
+        for key in scores:
+            value = fields.get(key.upper())
+            if value:
+                try:
+                    scores[key] = max(0, min(10, int(value.split()[0])))
+                except ValueError:
+                    pass
+
         return scores
-    
-    def _parse_notes(self, content: str) -> str:
-        """Extract interviewer notes from LLM response."""
-        lines = content.split("\n")
-        for i, line in enumerate(lines):
-            if line.startswith("NOTES:"):
-                notes = line.replace("NOTES:", "").strip()
-                for j in range(i + 1, len(lines)):
-                    notes += " " + lines[j].strip()
-                return notes.strip()
-        return "No additional notes."
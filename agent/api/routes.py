@@ -4,27 +4,85 @@ ARETE REST API Routes
 Endpoints for interview management, code execution, and results retrieval.
 """
 
+import asyncio
+import hashlib
+import signal
+import threading
+import time
 import uuid
 import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from typing import Any
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
-from ..graph.state import ProblemInfo, InterviewState
-from ..graph.orchestrator import run_interview, process_code_snapshot, finish_interview
+from .sessions import SessionStore, _packb, _unpackb
+from ..graph.state import ProblemInfo, InterviewState, append_transcript
+from ..graph.orchestrator import run_interview, process_code_snapshot, finish_interview, get_fairness_agent
 from ..events import get_session_events, get_session_transcript, log_event
 from ..config import get_settings
+from ..sandbox import _checker_for, _pin_worker, _worker_entry
 from livekit import api
 import os
-import json
+import aiofiles
+import anthropic
+import httpx
+import numpy as np
+import orjson
+
+
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["interviews"],
+    # orjson encodes the nested report/transcript payloads several times
+    # faster than the stdlib encoder FastAPI defaults to
+    default_response_class=ORJSONResponse,
+)
+
+
+# Session store: Redis-backed when available, in-process dict otherwise
+_sessions: SessionStore = SessionStore()
+
+
+# Shared Anthropic client for the chat endpoint: constructing one per
+# request paid httpx/TLS setup and lost connection reuse. HTTP/2 pooling
+# mirrors the shared async client the LLM agents use.
+_anthropic_client: anthropic.Anthropic | None = None
+
+
+def get_anthropic_client() -> anthropic.Anthropic:
+    """Get or create the shared Anthropic client."""
+    global _anthropic_client
+    if _anthropic_client is None:
+        _anthropic_client = anthropic.Anthropic(
+            api_key=get_settings().anthropic_api_key,
+            http_client=httpx.Client(
+                http2=True,
+                timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
+        )
+    return _anthropic_client
 
 
-router = APIRouter(prefix="/api/v1", tags=["interviews"])
+def close_anthropic_client() -> None:
+    """Close the shared Anthropic client (called on app shutdown)."""
+    global _anthropic_client
+    if _anthropic_client is not None:
+        _anthropic_client.close()
+        _anthropic_client = None
 
 
-# In-memory session store (upgrade to Redis in production)
-_sessions: dict[str, InterviewState] = {}
+# LiveKit tokens are deterministic per (session, candidate) within their
+# validity window, so signing is memoized with a short TTL. Same
+# TTL+size-bounded pattern as the interviewer's analysis cache.
+TOKEN_CACHE_TTL_SECONDS = 300.0
+TOKEN_CACHE_MAX_ENTRIES = 4096
+_token_cache: dict[tuple[str, str], tuple[float, str]] = {}
 
 
 # =============================================================================
@@ -130,28 +188,49 @@ def load_problems() -> dict[str, ProblemInfo]:
     """Load problems from JSON file."""
     try:
         json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "problems.json")
-        with open(json_path, "r") as f:
-            problems_data = json.load(f)
-        
-        bank = {}
-        for p in problems_data:
-            bank[p["id"]] = ProblemInfo(
-                id=p["id"],
-                title=p["title"],
-                difficulty=p["difficulty"],
-                prompt=p["prompt"],
-                starter_code=p["starter_code"],
-                optimal_approach=p["optimal_approach"],
-                constraints=p["constraints"],
-                test_cases=p["test_cases"]
-            )
-        return bank
+        with open(json_path, "rb") as f:
+            problems_data = orjson.loads(f.read())
+
+        # ProblemInfo is a TypedDict, so the decoded dicts already are the
+        # right shape -- index them directly instead of rebuilding each one
+        # field by field.
+        return {p["id"]: p for p in problems_data}
     except Exception as e:
         print(f"Error loading problems: {e}")
         return {}
 
 PROBLEM_BANK: dict[str, ProblemInfo] = load_problems()
 
+def _chat_prompt_prefix(problem: ProblemInfo) -> str:
+    """Build the static part of the chat system prompt for a problem."""
+    return f"""You are Sarah, a friendly and encouraging technical interviewer at a top tech company.
+You're conducting a coding interview for the "{problem['title']}" problem ({problem['difficulty']}).
+
+Problem: {problem['prompt']}
+
+Your role:
+- Be conversational, warm, and supportive
+- Give hints when asked, but don't give away the solution
+- Encourage the candidate when they're on the right track
+- Ask clarifying questions about their approach
+- Keep responses concise (2-3 sentences max)
+- If they share code, comment on their approach"""
+
+
+# Chat system prompts are fixed per problem; build them once at import so
+# each turn only appends the candidate's current code.
+_CHAT_PROMPT_CACHE: dict[str, str] = {
+    pid: _chat_prompt_prefix(p) for pid, p in PROBLEM_BANK.items()
+}
+
+
+# The problem bank is immutable at runtime, so the /problems response body
+# is serialized once at import instead of rebuilt and re-encoded per call.
+_PROBLEMS_JSON: bytes = orjson.dumps([
+    {"id": p["id"], "title": p["title"], "difficulty": p["difficulty"]}
+    for p in PROBLEM_BANK.values()
+])
+
 
 # =============================================================================
 # Endpoints
@@ -165,16 +244,30 @@ async def get_token(session_id: str, candidate_name: str) -> TokenResponse:
     if not settings.livekit_url or not settings.livekit_api_key or not settings.livekit_api_secret:
         raise HTTPException(status_code=500, detail="LiveKit not configured")
 
-    # Create token using builder pattern (new SDK API)
-    token = (
-        api.AccessToken(settings.livekit_api_key, settings.livekit_api_secret)
-        .with_identity(candidate_name)
-        .with_name(candidate_name)
-        .with_grants(api.VideoGrants(room_join=True, room=session_id))
-    )
-    
+    # Reuse a recently signed token for the same session/candidate
+    cache_key = (session_id, candidate_name)
+    cached = _token_cache.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        jwt = cached[1]
+    else:
+        # Create token using builder pattern (new SDK API)
+        token = (
+            api.AccessToken(settings.livekit_api_key, settings.livekit_api_secret)
+            .with_identity(candidate_name)
+            .with_name(candidate_name)
+            .with_grants(api.VideoGrants(room_join=True, room=session_id))
+        )
+        jwt = token.to_jwt()
+        if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            for stale in [k for k, (expiry, _) in _token_cache.items() if expiry <= now]:
+                del _token_cache[stale]
+            while len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+                _token_cache.pop(next(iter(_token_cache)))  # Oldest insertion first
+        _token_cache[cache_key] = (time.monotonic() + TOKEN_CACHE_TTL_SECONDS, jwt)
+
     return TokenResponse(
-        token=token.to_jwt(),
+        token=jwt,
         identity=candidate_name,
         room_name=session_id
     )
@@ -242,9 +335,8 @@ async def get_interview_status(session_id: str) -> SessionStatusResponse:
         )
     
     # Calculate elapsed time
-    started = datetime.fromisoformat(state["started_at"])
-    elapsed = int((datetime.now() - started).total_seconds() / 60)
-    
+    elapsed = int((time.time() - (_epoch_ts(state, "started_at") or time.time())) / 60)
+
     return SessionStatusResponse(
         session_id=session_id,
         is_complete=state.get("interview_complete", False),
@@ -272,7 +364,21 @@ async def submit_code_snapshot(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Interview already completed"
         )
-    
+
+    # Unchanged code (candidate reading, not typing) skips the agent and
+    # the event log. Frames fall through again once the snapshot has sat
+    # past the stuck window, so the agent can still offer a nudge -- and
+    # because idle frames no longer touch last_code_change_at, the agent
+    # sees the true time since the last real edit.
+    if request.code == state.get("code_snapshot", ""):
+        last_change = state.get("last_code_change_at")
+        idle_seconds = (
+            (datetime.now() - datetime.fromisoformat(last_change)).total_seconds()
+            if last_change else 0.0
+        )
+        if idle_seconds < get_settings().stuck_timeout_seconds:
+            return CodeSnapshotResponse(has_response=False, message=None, action=None)
+
     # Log code snapshot event
     log_event(
         "CODE_SNAPSHOT",
@@ -281,7 +387,7 @@ async def submit_code_snapshot(
     )
     
     # Process with agent
-    new_state, message = process_code_snapshot(state, request.code)
+    new_state, message = await process_code_snapshot(state, request.code)
     
     # Update session
     _sessions[session_id] = new_state
@@ -304,9 +410,10 @@ async def run_code(session_id: str, request: RunCodeRequest) -> RunCodeResponse:
         )
     
     problem = state["problem"]
-    
-    # Execute code against test cases
-    result = _execute_code(request.code, problem)
+
+    # Execute code against test cases; iterative runs stop at the first
+    # failing case, only the final submission runs the full suite
+    result = await _execute_code_async(request.code, problem, stop_on_first_fail=True)
     
     # Log event
     log_event(
@@ -339,43 +446,21 @@ async def submit_solution(
     
     # Run final tests
     problem = state["problem"]
-    test_results = _execute_code(request.code, problem)
+    test_results = await _execute_code_async(request.code, problem)
     
     # Update code snapshot
     state["code_snapshot"] = request.code
     
     # Complete interview (runs scoring + fairness)
-    final_state = finish_interview(state, test_results)
+    final_state = await finish_interview(state, test_results)
     
     # Update session
     _sessions[session_id] = final_state
-    
-    # Calculate duration
-    started = datetime.fromisoformat(final_state["started_at"])
-    ended = datetime.fromisoformat(final_state.get("ended_at") or datetime.now().isoformat())
-    duration = int((ended - started).total_seconds() / 60)
-    
-    # Get scores
-    fairness_result = final_state.get("fairness_result", {})
-    scores = fairness_result.get("normalized_scores", final_state.get("raw_scores", {}))
-    
-    overall = sum(scores.values()) / len(scores) if scores else 0
-    
-    return InterviewReportResponse(
-        session_id=session_id,
-        candidate_name=final_state["candidate_name"],
-        problem_title=final_state["problem"]["title"],
-        duration_minutes=duration,
-        scores=scores,
-        overall_score=round(overall, 1),
-        recommendation=final_state.get("final_recommendation", "PENDING"),
-        fairness={
-            "bias_detected": fairness_result.get("bias_detected", False),
-            "fairness_score": fairness_result.get("fairness_score", 0),
-            "flags": fairness_result.get("flags", []),
-        },
-        transcript=get_session_transcript(session_id),
-    )
+
+    # Persist to disk so the report survives a restart
+    await _persist_session(session_id, final_state)
+
+    return _build_report(session_id, final_state)
 
 
 @router.get("/interviews/{session_id}/report", response_model=InterviewReportResponse)
@@ -383,13 +468,20 @@ async def get_interview_report(session_id: str) -> InterviewReportResponse:
     """Get final interview report for a completed session."""
     state = _sessions.get(session_id)
     
-    # helper to load from disk if missing
+    # helper to load from disk if missing; aiofiles keeps the read off
+    # the event loop. Current files are msgpack; .json covers sessions
+    # persisted before the binary format.
     if not state:
         try:
-            filename = f"session_{session_id}.json"
+            filename = f"session_{session_id}.msgpack"
             if os.path.exists(filename):
-                with open(filename, "r") as f:
-                    state = json.load(f)
+                async with aiofiles.open(filename, "rb") as f:
+                    state = _unpackb(await f.read())
+            else:
+                filename = f"session_{session_id}.json"
+                if os.path.exists(filename):
+                    async with aiofiles.open(filename, "rb") as f:
+                        state = orjson.loads(await f.read())
         except Exception:
             pass
 
@@ -405,41 +497,13 @@ async def get_interview_report(session_id: str) -> InterviewReportResponse:
             detail="Interview not yet completed"
         )
     
-    # Calculate duration
-    started = datetime.fromisoformat(state["started_at"])
-    ended = datetime.fromisoformat(state.get("ended_at") or datetime.now().isoformat())
-    duration = int((ended - started).total_seconds() / 60)
-    
-    # Get scores
-    fairness_result = state.get("fairness_result", {})
-    scores = fairness_result.get("normalized_scores", state.get("raw_scores", {}))
-    
-    overall = sum(scores.values()) / len(scores) if scores else 0
-    
-    return InterviewReportResponse(
-        session_id=session_id,
-        candidate_name=state["candidate_name"],
-        problem_title=state["problem"]["title"],
-        duration_minutes=duration,
-        scores=scores,
-        overall_score=round(overall, 1),
-        recommendation=state.get("final_recommendation", "PENDING"),
-        fairness={
-            "bias_detected": fairness_result.get("bias_detected", False),
-            "fairness_score": fairness_result.get("fairness_score", 0),
-            "flags": fairness_result.get("flags", []),
-        },
-        transcript=get_session_transcript(session_id),
-    )
+    return _build_report(session_id, state)
 
 
 @router.get("/problems")
-async def list_problems() -> list[dict[str, str]]:
+async def list_problems() -> Response:
     """List available problems."""
-    return [
-        {"id": p["id"], "title": p["title"], "difficulty": p["difficulty"]}
-        for p in PROBLEM_BANK.values()
-    ]
+    return Response(content=_PROBLEMS_JSON, media_type="application/json")
 
 
 class ChatRequest(BaseModel):
@@ -456,8 +520,6 @@ class ChatResponse(BaseModel):
 @router.post("/interviews/{session_id}/chat", response_model=ChatResponse)
 async def chat_with_interviewer(session_id: str, request: ChatRequest) -> ChatResponse:
     """Send a message to the AI interviewer and get a response."""
-    import anthropic
-
     state = _sessions.get(session_id)
     if not state:
         # For demo mode, create a temporary context
@@ -470,27 +532,15 @@ async def chat_with_interviewer(session_id: str, request: ChatRequest) -> ChatRe
 
     problem = state.get("problem", PROBLEM_BANK.get("two_sum"))
 
-    # Build context for AI
-    system_prompt = f"""You are Sarah, a friendly and encouraging technical interviewer at a top tech company.
-You're conducting a coding interview for the "{problem['title']}" problem ({problem['difficulty']}).
-
-Problem: {problem['prompt']}
-
-Your role:
-- Be conversational, warm, and supportive
-- Give hints when asked, but don't give away the solution
-- Encourage the candidate when they're on the right track
-- Ask clarifying questions about their approach
-- Keep responses concise (2-3 sentences max)
-- If they share code, comment on their approach
-
-Current code the candidate is working on:
-{request.code or "No code yet"}
-"""
+    # Static prefix is precomputed per problem; only the code block varies
+    prefix = _CHAT_PROMPT_CACHE.get(problem["id"]) or _chat_prompt_prefix(problem)
+    system_prompt = (
+        prefix
+        + f"\n\nCurrent code the candidate is working on:\n{request.code or 'No code yet'}\n"
+    )
 
     try:
-        settings = get_settings()
-        client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+        client = get_anthropic_client()
 
         # Get conversation history
         messages = []
@@ -514,9 +564,13 @@ Current code the candidate is working on:
 
         # Update conversation history
         if session_id in _sessions:
-            _sessions[session_id].setdefault("conversation_history", [])
-            _sessions[session_id]["conversation_history"].append({"role": "user", "content": request.message})
-            _sessions[session_id]["conversation_history"].append({"role": "assistant", "content": ai_response})
+            session_state = _sessions[session_id]
+            session_state.setdefault("conversation_history", [])
+            session_state["conversation_history"].append({"role": "user", "content": request.message})
+            session_state["transcript_text"] = append_transcript(session_state, "candidate", request.message)
+            session_state["conversation_history"].append({"role": "assistant", "content": ai_response})
+            session_state["transcript_text"] = append_transcript(session_state, "interviewer", ai_response)
+            _sessions[session_id] = session_state
 
         return ChatResponse(response=ai_response)
 
@@ -526,107 +580,250 @@ Current code the candidate is working on:
         return ChatResponse(response="I'm having trouble connecting. Could you repeat that?")
 
 
+class FairnessBatchRequest(BaseModel):
+    """Bulk fairness audit over completed sessions."""
+    session_ids: list[str] = Field(..., min_length=1)
+
+
+class FairnessBatchResponse(BaseModel):
+    """Submitted batch job details."""
+    batch_id: str
+    num_interviews: int
+
+
+def _batch_fairness_agent():
+    """The fairness agent, or a 503 if no Batch API provider is configured."""
+    fairness = get_fairness_agent()
+    if fairness.client is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=(
+                "Batch API not configured: set BATCH_API_KEY to a "
+                "Batch-capable provider (OpenRouter does not implement "
+                "/v1/files or /v1/batches)"
+            ),
+        )
+    return fairness
+
+
+@router.post("/fairness/batch", response_model=FairnessBatchResponse)
+async def submit_fairness_batch(request: FairnessBatchRequest) -> FairnessBatchResponse:
+    """Submit completed interviews for bulk fairness re-analysis via the Batch API."""
+    states = []
+    for session_id in request.session_ids:
+        state = _sessions.get(session_id)
+        if not state:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Session '{session_id}' not found"
+            )
+        states.append(state)
+
+    fairness = _batch_fairness_agent()
+    batch_id = fairness.submit_batch(states)
+
+    return FairnessBatchResponse(batch_id=batch_id, num_interviews=len(states))
+
+
+@router.get("/fairness/batch/{batch_id}")
+async def poll_fairness_batch(batch_id: str) -> dict[str, Any]:
+    """Poll a fairness batch job; returns parsed results once completed."""
+    fairness = _batch_fairness_agent()
+    results = fairness.poll_batch(batch_id, _sessions)
+
+    if results is None:
+        return {"batch_id": batch_id, "status": "in_progress", "results": None}
+
+    return {
+        "batch_id": batch_id,
+        "status": "completed",
+        "results": {sid: dict(result) for sid, result in results.items()},
+    }
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-def _worker_entry(code: str, test_cases: list[dict], q: multiprocessing.Queue):
-    """Worker process for code execution."""
-    result = {
-        "passed": 0,
-        "failed": 0,
-        "total": len(test_cases),
-        "details": [],
-        "stderr": None,
-    }
-    
+def _build_report(session_id: str, state: InterviewState) -> InterviewReportResponse:
+    """
+    Build the final report for a completed session.
+
+    Shared by the submit and report handlers. Uses model_construct since
+    every field comes from state we produced ourselves, skipping a full
+    Pydantic validation pass per fetch.
+    """
+    started_ts = _epoch_ts(state, "started_at") or time.time()
+    ended_ts = _epoch_ts(state, "ended_at") or time.time()
+    duration = int((ended_ts - started_ts) / 60)
+
+    fairness_result = state.get("fairness_result") or {}
+    scores = state.get("scores_effective")
+    if scores is None:
+        # Sessions finished before the derived fields existed
+        scores = fairness_result.get("normalized_scores", state.get("raw_scores", {}))
+    overall = state.get("overall_score")
+    if overall is None:
+        overall = round(_overall_score(scores), 1)
+
+    return InterviewReportResponse.model_construct(
+        session_id=session_id,
+        candidate_name=state["candidate_name"],
+        problem_title=state["problem"]["title"],
+        duration_minutes=duration,
+        scores=scores,
+        overall_score=overall,
+        recommendation=state.get("final_recommendation", "PENDING"),
+        fairness={
+            "bias_detected": fairness_result.get("bias_detected", False),
+            "fairness_score": fairness_result.get("fairness_score", 0),
+            "flags": fairness_result.get("flags", []),
+        },
+        transcript=get_session_transcript(session_id),
+    )
+
+
+def _overall_score(scores: dict[str, int]) -> float:
+    """
+    Mean over a score dict.
+
+    The four-dimension interview rubric takes the plain Python path;
+    larger score sets (batch re-audits) get NumPy's C-level reducer.
+    """
+    if not scores:
+        return 0.0
+    if len(scores) <= 4:
+        return sum(scores.values()) / len(scores)
+    vals = np.fromiter(scores.values(), dtype=np.float64, count=len(scores))
+    return float(vals.mean())
+
+
+def _epoch_ts(state: InterviewState, key: str) -> float | None:
+    """
+    Epoch seconds for a started_at/ended_at field.
+
+    Prefers the stored float, falling back to parsing the ISO string for
+    sessions persisted before the timestamp field existed.
+    """
+    ts = state.get(key + "_ts")
+    if ts is not None:
+        return ts
+    iso = state.get(key)
+    return datetime.fromisoformat(iso).timestamp() if iso else None
+
+
+async def _persist_session(session_id: str, state: InterviewState) -> None:
+    """Write a completed session to disk without blocking the event loop."""
     try:
-        # Create namespace and exec code
-        namespace: dict[str, Any] = {}
-        exec(code, namespace)
-        
-        # Find the function (assumes first function defined)
-        func_name = None
-        for name, obj in namespace.items():
-            if callable(obj) and not name.startswith("_"):
-                func_name = name
-                break
-        
-        if not func_name:
-            result["stderr"] = "No function defined"
-            q.put(result)
-            return
-        
-        func = namespace[func_name]
-        
-        # Run test cases
-        for i, tc in enumerate(test_cases):
-            try:
-                # Handle different input formats
-                if isinstance(tc["input"], dict):
-                    actual = func(**tc["input"])
-                else:
-                    actual = func(tc["input"])
-                
-                expected = tc["expected"]
-                
-                # Compare (handle list order for some problems)
-                if isinstance(expected, list) and isinstance(actual, list):
-                    passed = sorted(map(str, actual)) == sorted(map(str, expected)) or actual == expected
-                else:
-                    passed = actual == expected
-                
-                if passed:
-                    result["passed"] += 1
-                else:
-                    result["failed"] += 1
-                
-                result["details"].append({
-                    "case": i + 1,
-                    "passed": passed,
-                    "input": tc["input"],
-                    "expected": expected,
-                    "actual": actual,
-                })
-            except Exception as e:
-                result["failed"] += 1
-                result["details"].append({
-                    "case": i + 1,
-                    "passed": False,
-                    "input": tc["input"],
-                    "error": str(e),
-                })
+        async with aiofiles.open(f"session_{session_id}.msgpack", "wb") as f:
+            await f.write(_packb(state))
     except Exception as e:
-        result["stderr"] = str(e)
-    
-    q.put(result)
+        print(f"Session persist failed: {e}")
+
+def _sandbox_cores() -> list[int]:
+    """
+    Cores reserved for sandbox workers: the upper half of the affinity
+    mask, leaving the lower half to uvicorn's event loop so candidate
+    code doesn't contend with request handling.
+    """
+    try:
+        available = sorted(os.sched_getaffinity(0))
+    except AttributeError:
+        return []  # Not available on this platform
+    if len(available) < 2:
+        return []
+    return available[len(available) // 2:]
+
+
+def _create_executor() -> ProcessPoolExecutor:
+    """Build the pre-warmed sandbox worker pool, one worker per reserved core."""
+    # forkserver workers fork from a minimal template process that has
+    # imported only agent.sandbox, so they don't carry a copy of the
+    # FastAPI/LangGraph app the way plain fork children would
+    try:
+        mp_context = multiprocessing.get_context("forkserver")
+        mp_context.set_forkserver_preload(["agent.sandbox"])
+    except (ValueError, AttributeError):
+        try:
+            mp_context = multiprocessing.get_context("fork")
+        except ValueError:
+            mp_context = None  # Neither start method on this platform
+    cores = _sandbox_cores()
+    counter = (mp_context or multiprocessing).Value("i", 0)
+    return ProcessPoolExecutor(
+        max_workers=len(cores) or os.cpu_count(),
+        mp_context=mp_context,
+        initializer=_pin_worker,
+        initargs=(counter, cores),
+    )
 
 
-def _execute_code(code: str, problem: ProblemInfo) -> dict[str, Any]:
+# Persistent sandbox pool: spawning a fresh Process per /run paid
+# fork + interpreter-init latency on every call; pooled workers are reused
+# across requests and only recycled when a task times out or crashes.
+_EXECUTOR = _create_executor()
+
+# Guards the _EXECUTOR swap in _recycle_executor so concurrent failures
+# on the same pool can't each stand up (and then kill) a replacement
+_executor_lock = threading.Lock()
+
+# Cap concurrent sandbox runs at the pool size so a burst of /run calls
+# queues in the event loop instead of piling tasks onto the workers,
+# where they'd wait for a worker with their 5s timeout clock running
+_run_semaphore = asyncio.Semaphore(_EXECUTOR._max_workers)
+
+
+def warm_executor() -> None:
     """
-    Execute candidate code against test cases with timeout.
-    
-    Runs in a separate process to allow termination of infinite loops.
+    Spin up all pool workers ahead of the first candidate run.
+
+    ProcessPoolExecutor forks workers lazily on submit, which would put
+    the fork cost on the first /run of the day; a round of no-op tasks
+    at startup absorbs it instead.
     """
-    q = multiprocessing.Queue()
-    p = multiprocessing.Process(target=_worker_entry, args=(code, problem["test_cases"], q))
-    p.start()
-    p.join(timeout=5.0) # 5 second timeout
-    
-    if p.is_alive():
-        p.terminate()
-        p.join()
-        return {
-            "passed": 0,
-            "failed": len(problem["test_cases"]),
-            "total": len(problem["test_cases"]),
-            "details": [],
-            "stderr": "Timeout: Code execution exceeded 2 seconds."
-        }
-    
-    if not q.empty():
-        return q.get()
-    
+    workers = _EXECUTOR._max_workers
+    for future in [_EXECUTOR.submit(os.getpid) for _ in range(workers)]:
+        try:
+            future.result(timeout=10.0)
+        except Exception:
+            break
+
+
+def _recycle_executor(executor: ProcessPoolExecutor) -> None:
+    """
+    Kill a wedged pool's workers and stand up a fresh one.
+
+    Callers pass the executor they submitted to; only the first report
+    against a given pool swaps in a replacement. In-flight runs that die
+    with it hit this too, but their pool is no longer current by then,
+    so they return without touching the new workers.
+    """
+    global _EXECUTOR
+    with _executor_lock:
+        if executor is not _EXECUTOR:
+            return
+        _EXECUTOR = _create_executor()
+    for pid in list(getattr(executor, "_processes", {})):
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except (ProcessLookupError, OSError):
+            pass
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _timeout_result(problem: ProblemInfo) -> dict[str, Any]:
+    """Result dict for a run killed by the 5s timeout."""
+    return {
+        "passed": 0,
+        "failed": len(problem["test_cases"]),
+        "total": len(problem["test_cases"]),
+        "details": [],
+        "stderr": "Timeout: Code execution exceeded 5 seconds."
+    }
+
+
+def _crash_result(problem: ProblemInfo) -> dict[str, Any]:
+    """Result dict for a run whose worker process died."""
     return {
         "passed": 0,
         "failed": len(problem["test_cases"]),
@@ -634,3 +831,99 @@ def _execute_code(code: str, problem: ProblemInfo) -> dict[str, Any]:
         "details": [],
         "stderr": "Execution failed (Process crashed)"
     }
+
+
+# Judge result memo: candidates press Run repeatedly on the same code to
+# re-read failures, and submit re-runs the last /run's code. Keyed by
+# problem, code digest and run mode; error results (timeouts, crashes)
+# are never cached so a transient failure can't stick.
+JUDGE_CACHE_TTL_SECONDS = 300.0
+JUDGE_CACHE_MAX_ENTRIES = 1024
+_judge_cache: OrderedDict[tuple[str, bytes, bool], tuple[float, dict[str, Any]]] = OrderedDict()
+
+
+def _judge_cache_key(code: str, problem: ProblemInfo, stop_on_first_fail: bool) -> tuple[str, bytes, bool]:
+    return (problem["id"], hashlib.sha1(code.encode()).digest(), stop_on_first_fail)
+
+
+def _judge_cache_get(key: tuple[str, bytes, bool]) -> dict[str, Any] | None:
+    entry = _judge_cache.get(key)
+    if entry is None or time.monotonic() - entry[0] >= JUDGE_CACHE_TTL_SECONDS:
+        return None
+    _judge_cache.move_to_end(key)
+    return entry[1]
+
+
+def _judge_cache_put(key: tuple[str, bytes, bool], result: dict[str, Any]) -> None:
+    if result.get("stderr") is not None:
+        return
+    _judge_cache[key] = (time.monotonic(), result)
+    _judge_cache.move_to_end(key)
+    while len(_judge_cache) > JUDGE_CACHE_MAX_ENTRIES:
+        _judge_cache.popitem(last=False)
+
+
+async def _execute_code_async(
+    code: str,
+    problem: ProblemInfo,
+    stop_on_first_fail: bool = False,
+) -> dict[str, Any]:
+    """
+    Execute candidate code without blocking the event loop.
+
+    Awaits the pool future directly (no thread-pool hop): the handler's
+    coroutine suspends for up to the 5s timeout while other sessions'
+    requests keep being served.
+    """
+    key = _judge_cache_key(code, problem, stop_on_first_fail)
+    cached = _judge_cache_get(key)
+    if cached is not None:
+        return cached
+
+    async with _run_semaphore:
+        executor = _EXECUTOR
+        future = executor.submit(
+            _worker_entry, code, problem["test_cases"], _checker_for(problem), stop_on_first_fail
+        )
+
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=5.0)
+        except asyncio.TimeoutError:
+            # The worker is wedged in candidate code; kill the pool so the
+            # stuck task can't hold a slot, and warm a fresh one.
+            _recycle_executor(executor)
+            return _timeout_result(problem)
+        except BrokenProcessPool:
+            _recycle_executor(executor)
+            return _crash_result(problem)
+
+    _judge_cache_put(key, result)
+    return result
+
+
+def _execute_code(code: str, problem: ProblemInfo) -> dict[str, Any]:
+    """
+    Synchronous variant of _execute_code_async for non-async callers.
+
+    Runs in a pooled worker process so infinite loops can be killed
+    without paying process startup on every call.
+    """
+    key = _judge_cache_key(code, problem, stop_on_first_fail=False)
+    cached = _judge_cache_get(key)
+    if cached is not None:
+        return cached
+
+    executor = _EXECUTOR
+    future = executor.submit(_worker_entry, code, problem["test_cases"], _checker_for(problem))
+
+    try:
+        result = future.result(timeout=5.0)
+    except FutureTimeout:
+        _recycle_executor(executor)
+        return _timeout_result(problem)
+    except BrokenProcessPool:
+        _recycle_executor(executor)
+        return _crash_result(problem)
+
+    _judge_cache_put(key, result)
+    return result
@@ -0,0 +1,187 @@
+"""
+ARETE Session Store
+
+Redis-backed storage for interview session state, so sessions survive
+restarts and can be shared across multiple Uvicorn/Gunicorn workers.
+Values are msgpack-encoded (smaller and faster to (de)serialize than
+JSON for the nested state dicts), with a JSON fallback if msgpack is
+not installed.
+
+Falls back transparently to an in-process dict when Redis is not
+reachable (single-worker dev setups and tests).
+"""
+
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, MutableMapping
+from typing import Any, Iterator
+
+import redis
+
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+try:
+    import ormsgpack
+
+    def _packb(obj: Any) -> bytes:
+        return ormsgpack.packb(obj)
+
+    def _unpackb(data: bytes) -> Any:
+        return ormsgpack.unpackb(data)
+
+except ImportError:
+    import json
+
+    def _packb(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _unpackb(data: bytes) -> Any:
+        return json.loads(data)
+
+
+# Sessions expire after 24h; live interviews are capped at 30 minutes
+SESSION_TTL_SECONDS = 86400
+
+# Bound on the in-worker L1 cache in front of Redis; least recently used
+# sessions are evicted first (they still live in Redis)
+L1_MAX_ENTRIES = 1024
+
+_KEY_PREFIX = "sess:"
+
+
+class SessionStore(MutableMapping):
+    """
+    Dict-like session store backed by Redis, with a bounded in-worker
+    LRU cache in front of it.
+
+    Keeps the `_sessions[session_id]` access pattern used throughout the
+    API layer while making state cross-process. Reads are served from the
+    L1 cache when the session was last touched by this worker; writes go
+    through to Redis and refresh the L1 entry, so a worker always sees
+    its own updates without a roundtrip. Note that values read from
+    Redis are copies: mutate-then-store (`store[sid] = state`) is
+    required for updates to persist.
+    """
+
+    def __init__(self, redis_url: str | None = None):
+        self._redis_url = redis_url or get_settings().redis_url
+        self._redis: redis.Redis | None = None
+        self._checked = False
+        self._fallback: dict[str, Any] = {}
+        self._l1: OrderedDict[str, Any] = OrderedDict()
+
+    def _client(self) -> redis.Redis | None:
+        """Lazily connect to Redis; cache the result (or the failure)."""
+        if not self._checked:
+            self._checked = True
+            try:
+                client = redis.Redis.from_url(self._redis_url)
+                client.ping()
+                self._redis = client
+            except Exception as e:
+                logger.warning(
+                    f"Redis unavailable ({e}); using in-process session store"
+                )
+        return self._redis
+
+    def _cache_l1(self, session_id: str, state: Any) -> None:
+        """Insert/refresh an L1 entry, evicting the least recently used."""
+        self._l1[session_id] = state
+        self._l1.move_to_end(session_id)
+        while len(self._l1) > L1_MAX_ENTRIES:
+            self._l1.popitem(last=False)
+
+    def __getitem__(self, session_id: str) -> Any:
+        client = self._client()
+        if client is None:
+            return self._fallback[session_id]
+        if session_id in self._l1:
+            self._l1.move_to_end(session_id)
+            return self._l1[session_id]
+        data = client.get(_KEY_PREFIX + session_id)
+        if data is None:
+            raise KeyError(session_id)
+        state = _unpackb(data)
+        self._cache_l1(session_id, state)
+        return state
+
+    def __setitem__(self, session_id: str, state: Any) -> None:
+        client = self._client()
+        if client is None:
+            self._fallback[session_id] = state
+        else:
+            # Write-through: Redis is the source of truth, L1 just skips
+            # the roundtrip for sessions this worker already touched
+            client.set(_KEY_PREFIX + session_id, _packb(state), ex=SESSION_TTL_SECONDS)
+            self._cache_l1(session_id, state)
+
+    def update_atomic(
+        self,
+        session_id: str,
+        mutate: Callable[[Any], Any],
+        max_retries: int = 5,
+    ) -> Any:
+        """
+        Read-modify-write a session under optimistic concurrency.
+
+        `mutate` receives the current state and returns the new one. The
+        write only lands if no other worker touched the key in between
+        (Redis WATCH/MULTI); on conflict the read-and-mutate is retried
+        with fresh state instead of overwriting the other worker's
+        update. `mutate` must be a quick, side-effect-free transform —
+        it can run more than once. Falls back to last-writer-wins after
+        `max_retries` conflicts so a hot session can't stall a handler.
+        """
+        client = self._client()
+        if client is None:
+            state = mutate(self._fallback[session_id])
+            self._fallback[session_id] = state
+            return state
+        key = _KEY_PREFIX + session_id
+        for _ in range(max_retries):
+            with client.pipeline() as pipe:
+                try:
+                    pipe.watch(key)
+                    data = pipe.get(key)
+                    if data is None:
+                        pipe.unwatch()
+                        raise KeyError(session_id)
+                    state = mutate(_unpackb(data))
+                    pipe.multi()
+                    pipe.set(key, _packb(state), ex=SESSION_TTL_SECONDS)
+                    pipe.execute()
+                    self._cache_l1(session_id, state)
+                    return state
+                except redis.WatchError:
+                    continue
+        state = mutate(self[session_id])
+        self[session_id] = state
+        return state
+
+    def __delitem__(self, session_id: str) -> None:
+        client = self._client()
+        if client is None:
+            del self._fallback[session_id]
+            return
+        self._l1.pop(session_id, None)
+        if not client.delete(_KEY_PREFIX + session_id):
+            raise KeyError(session_id)
+
+    def __iter__(self) -> Iterator[str]:
+        client = self._client()
+        if client is None:
+            return iter(self._fallback)
+        prefix_len = len(_KEY_PREFIX)
+        return (
+            key.decode("utf-8")[prefix_len:]
+            for key in client.scan_iter(match=_KEY_PREFIX + "*")
+        )
+
+    def __len__(self) -> int:
+        client = self._client()
+        if client is None:
+            return len(self._fallback)
+        return sum(1 for _ in client.scan_iter(match=_KEY_PREFIX + "*"))
@@ -5,32 +5,41 @@ Real-time communication for live interview sessions.
 Handles code snapshots, agent responses, and session events.
 """
 
-import json
+import asyncio
 from datetime import datetime
 from typing import Any
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from pydantic import BaseModel
 
+from ..config import get_settings
 from ..events import log_event
-from ..graph.orchestrator import process_code_snapshot
-from .routes import _sessions, PROBLEM_BANK
+from ..graph.orchestrator import process_code_snapshot, finish_interview
+from ..graph.state import append_transcript, MAX_CONVERSATION_MESSAGES
+from .routes import _sessions, PROBLEM_BANK, _execute_code_async, _persist_session
 
 
 websocket_router = APIRouter()
 
+# A session has at most the candidate plus a few observer tabs; anything
+# beyond this is a reconnect leak or abuse, not legitimate fanout
+MAX_CONNS_PER_SESSION = 8
+
 
 class ConnectionManager:
     """Manages active WebSocket connections by session."""
-    
+
     def __init__(self):
         self.active_connections: dict[str, list[WebSocket]] = {}
-    
-    async def connect(self, websocket: WebSocket, session_id: str):
-        """Accept and register a new connection."""
+
+    async def connect(self, websocket: WebSocket, session_id: str) -> bool:
+        """Accept and register a new connection; False if the session is full."""
         await websocket.accept()
-        if session_id not in self.active_connections:
-            self.active_connections[session_id] = []
-        self.active_connections[session_id].append(websocket)
+        connections = self.active_connections.setdefault(session_id, [])
+        if len(connections) >= MAX_CONNS_PER_SESSION:
+            await websocket.close(code=4008, reason="Too many connections")
+            return False
+        connections.append(websocket)
+        return True
     
     def disconnect(self, websocket: WebSocket, session_id: str):
         """Remove a connection."""
@@ -42,16 +51,25 @@ class ConnectionManager:
     
     async def send_personal(self, websocket: WebSocket, message: dict[str, Any]):
         """Send message to a specific connection."""
-        await websocket.send_json(message)
-    
+        # orjson instead of send_json's stdlib dumps; still a text frame
+        # because the browser client JSON.parses event.data
+        await websocket.send_text(orjson.dumps(message).decode("utf-8"))
+
     async def broadcast_to_session(self, session_id: str, message: dict[str, Any]):
         """Broadcast message to all connections in a session."""
-        if session_id in self.active_connections:
-            for connection in self.active_connections[session_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    pass  # Connection may be closed
+        connections = list(self.active_connections.get(session_id, ()))
+        if not connections:
+            return
+        # Serialize once for all connections, then fan out concurrently so
+        # one slow client doesn't head-of-line block the others
+        data = orjson.dumps(message).decode("utf-8")
+        results = await asyncio.gather(
+            *(connection.send_text(data) for connection in connections),
+            return_exceptions=True,
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection, session_id)
 
 
 manager = ConnectionManager()
@@ -61,11 +79,9 @@ manager = ConnectionManager()
 # WebSocket Message Types
 # =============================================================================
 
-class WSMessage(BaseModel):
-    """Base WebSocket message."""
-    type: str
-    data: dict[str, Any] = {}
-
+# Frames are plain {"type": ..., "data": {...}} dicts parsed with orjson;
+# no Pydantic envelope on the per-frame path, handlers validate the few
+# fields they read via .get with defaults
 
 # Incoming message types
 MSG_CODE_SNAPSHOT = "code_snapshot"
@@ -105,7 +121,8 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
         return
     
     # Connect
-    await manager.connect(websocket, session_id)
+    if not await manager.connect(websocket, session_id):
+        return
     
     # Send initial state
     await manager.send_personal(websocket, {
@@ -123,10 +140,10 @@ async def interview_websocket(websocket: WebSocket, session_id: str):
             raw_data = await websocket.receive_text()
             
             try:
-                message = json.loads(raw_data)
+                message = orjson.loads(raw_data)
                 msg_type = message.get("type", "")
                 data = message.get("data", {})
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 await manager.send_personal(websocket, {
                     "type": MSG_ERROR,
                     "data": {"error": "Invalid JSON"}
@@ -177,7 +194,19 @@ async def handle_code_snapshot(
         return
     
     code = data.get("code", "")
-    
+
+    # Unchanged code (candidate reading, not typing) skips the agent and
+    # the event log, until the snapshot has sat past the stuck window --
+    # then one frame falls through so the agent can offer a nudge
+    if code == state.get("code_snapshot", ""):
+        last_change = state.get("last_code_change_at")
+        idle_seconds = (
+            (datetime.now() - datetime.fromisoformat(last_change)).total_seconds()
+            if last_change else 0.0
+        )
+        if idle_seconds < get_settings().stuck_timeout_seconds:
+            return
+
     # Log event
     log_event(
         "CODE_SNAPSHOT",
@@ -186,7 +215,7 @@ async def handle_code_snapshot(
     )
     
     # Process with agent
-    new_state, message = process_code_snapshot(state, code)
+    new_state, message = await process_code_snapshot(state, code)
     _sessions[session_id] = new_state
     
     # Send response if agent has something to say
@@ -220,17 +249,24 @@ async def handle_candidate_message(
         {"message": message}
     )
     
-    # Add to conversation history
-    if "conversation_history" not in state:
-        state["conversation_history"] = []
-    
-    state["conversation_history"].append({
-        "role": "candidate",
-        "content": message,
-        "timestamp": datetime.now().isoformat(),
-    })
-    
-    _sessions[session_id] = state
+    # Add to conversation history. The append is a plain read-modify-write,
+    # so do it under the store's optimistic-concurrency helper rather than
+    # clobbering updates from a concurrent snapshot handler.
+    def _append_message(current: dict[str, Any]) -> dict[str, Any]:
+        history = list(current.get("conversation_history", []))
+        history.append({
+            "role": "candidate",
+            "content": message,
+            "timestamp": datetime.now().isoformat(),
+        })
+        current["conversation_history"] = history[-MAX_CONVERSATION_MESSAGES:]
+        current["transcript_text"] = append_transcript(current, "candidate", message)
+        return current
+
+    try:
+        _sessions.update_atomic(session_id, _append_message)
+    except KeyError:
+        return
     
     # TODO: Generate agent response to candidate message
     # For now, acknowledge receipt
@@ -255,12 +291,9 @@ async def handle_run_code(
         return
     
     code = data.get("code", state.get("code_snapshot", ""))
-    
-    # Import here to avoid circular import
-    from .routes import _execute_code
-    
-    # Execute code
-    result = _execute_code(code, state["problem"])
+
+    # Execute code; iterative runs stop at the first failing case
+    result = await _execute_code_async(code, state["problem"], stop_on_first_fail=True)
     
     # Log event
     log_event(
@@ -282,37 +315,37 @@ async def handle_submit(
     data: dict[str, Any]
 ):
     """Handle final solution submission."""
-    from .routes import _execute_code
-    from ..graph.orchestrator import finish_interview
-    
     state = _sessions.get(session_id)
     if not state:
         return
-    
+
     code = data.get("code", state.get("code_snapshot", ""))
-    
+
     # Run final tests
-    test_results = _execute_code(code, state["problem"])
+    test_results = await _execute_code_async(code, state["problem"])
     
     # Update code snapshot
     state["code_snapshot"] = code
     
     # Complete interview
-    final_state = finish_interview(state, test_results)
+    final_state = await finish_interview(state, test_results)
     _sessions[session_id] = final_state
+
+    # Persist to disk so the report survives a restart
+    await _persist_session(session_id, final_state)
     
-    # Get scores
+    # Get scores (derived once in finish_interview)
     fairness_result = final_state.get("fairness_result", {})
-    scores = fairness_result.get("normalized_scores", final_state.get("raw_scores", {}))
-    overall = sum(scores.values()) / len(scores) if scores else 0
-    
+    scores = final_state.get("scores_effective") or {}
+    overall = final_state.get("overall_score") or 0.0
+
     # Send completion message
     await manager.broadcast_to_session(session_id, {
         "type": MSG_INTERVIEW_COMPLETE,
         "data": {
             "test_results": test_results,
             "scores": scores,
-            "overall_score": round(overall, 1),
+            "overall_score": overall,
             "recommendation": final_state.get("final_recommendation", "PENDING"),
             "fairness": {
                 "bias_detected": fairness_result.get("bias_detected", False),
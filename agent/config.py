@@ -30,6 +30,20 @@ class Settings(BaseSettings):
     # Models (via OpenRouter)
     interviewer_model: str = "@preset/llama-groq-3-3-70b"
     fairness_model: str = "google/gemini-3-pro-preview"
+    # Voice path: optional low-TTFT overrides for the LiveKit agent. LLM
+    # time-to-first-token dominates per-turn voice latency, so the voice
+    # loop can point at a smaller/faster model (or a different endpoint)
+    # than the text interviewer without changing either default.
+    voice_model: str = ""
+    voice_model_base_url: str = ""
+    # Batch API (bulk fairness audits). OpenRouter implements neither
+    # /v1/files nor /v1/batches, so batch jobs need a provider that
+    # does (e.g. the OpenAI platform) with its own key and a model id
+    # that provider serves. Left unset, the batch endpoints report
+    # themselves as not configured instead of failing mid-submit.
+    batch_api_key: str = ""
+    batch_base_url: str = "https://api.openai.com/v1"
+    batch_model: str = "gpt-4o-mini"
     
     # LiveKit (Video + Voice)
     livekit_url: str = ""
@@ -56,6 +70,16 @@ class Settings(BaseSettings):
     # Redis (Caching)
     redis_url: str = "redis://localhost:6379"
     
+    # Voice turn-taking. The silence window is the floor on how fast the
+    # agent can respond after the candidate stops talking, so it runs
+    # well under Silero's 0.55s default; exposed here so deployments can
+    # trade endpoint speed against false-endpoint risk without a deploy.
+    vad_min_speech_duration: float = 0.05
+    vad_min_silence_duration: float = 0.2
+    vad_activation_threshold: float = 0.5
+    # How long the candidate must speak before the agent stops talking
+    min_interruption_duration: float = 0.3
+
     # Interview Settings
     code_snapshot_interval_seconds: float = 1.5
     stuck_timeout_seconds: float = 120.0  # 2 minutes
@@ -3,18 +3,139 @@ ARETE Event Store
 In-memory event logging with upgrade path to Redis/PostgreSQL.
 """
 
+import logging
+import queue
 from datetime import datetime
 from typing import Any
-from collections import defaultdict
+from collections import defaultdict, deque
 import threading
 
 from .types import EventType, InterviewEvent, EventPriority
 
+logger = logging.getLogger(__name__)
+
+
+# Global event list is a ring buffer: it only feeds the "recent events"
+# debug view, so old entries can drop instead of growing without bound
+# for the life of the process
+RECENT_EVENTS_MAX = 4096
 
 # Thread-safe in-memory store
 _lock = threading.Lock()
-_event_log: list[InterviewEvent] = []
-_session_index: dict[str, list[int]] = defaultdict(list)  # session_id -> event indices
+_recent_events: deque[InterviewEvent] = deque(maxlen=RECENT_EVENTS_MAX)
+_session_events: dict[str, list[InterviewEvent]] = defaultdict(list)
+
+# Display-ready transcript entries, built once at log time so report
+# fetches don't rewalk and re-filter the whole event log per call.
+# Frozenset membership is a single hash probe instead of up to three
+# string comparisons per logged event.
+_TRANSCRIPT_TYPES = frozenset({"CANDIDATE_MESSAGE", "AGENT_RESPONSE", "HINT_GIVEN"})
+_session_transcripts: dict[str, list[dict[str, Any]]] = defaultdict(list)
+
+# Durable sink: events are mirrored onto a per-session Redis Stream so
+# they survive restarts and can be consumed by external analytics. The
+# in-process structures above stay authoritative for queries; the sink
+# is fire-and-forget and disables itself if Redis is unreachable, same
+# as the session store's fallback.
+STREAM_KEY_PREFIX = "interview:events:"
+STREAM_MAXLEN = 10000
+
+_stream_client = None
+_stream_checked = False
+
+
+def _stream():
+    """Lazily connect the Redis Stream sink; cache the result (or failure)."""
+    global _stream_client, _stream_checked
+    if not _stream_checked:
+        _stream_checked = True
+        try:
+            import redis
+
+            from ..config import get_settings
+
+            client = redis.Redis.from_url(get_settings().redis_url)
+            client.ping()
+            _stream_client = client
+        except Exception as e:
+            logger.warning(f"Redis unavailable ({e}); event stream sink disabled")
+    return _stream_client
+
+
+# Sink writes go through a bounded queue drained by a daemon thread, so
+# the request path never waits on Redis and bursts collapse into one
+# pipelined round-trip per batch. A thread (not an asyncio task) because
+# log_event is also called from synchronous contexts.
+SINK_QUEUE_MAX = 10000
+SINK_BATCH_MAX = 100
+
+_sink_queue: queue.Queue = queue.Queue(maxsize=SINK_QUEUE_MAX)
+_sink_thread: threading.Thread | None = None
+_sink_thread_lock = threading.Lock()
+
+
+def _sink_event(event: InterviewEvent) -> None:
+    """Queue an event for the Redis Stream sink (best effort)."""
+    global _sink_thread
+    if _sink_thread is None:
+        with _sink_thread_lock:
+            if _sink_thread is None:
+                _sink_thread = threading.Thread(
+                    target=_sink_loop, name="event-sink", daemon=True
+                )
+                _sink_thread.start()
+    try:
+        _sink_queue.put_nowait(event)
+    except queue.Full:
+        pass  # Sink is best effort; in-process stores are authoritative
+
+
+def _sink_loop() -> None:
+    """Drain queued events into per-session streams, batched per pipeline."""
+    global _stream_client
+    while True:
+        batch = [_sink_queue.get()]
+        while len(batch) < SINK_BATCH_MAX:
+            try:
+                batch.append(_sink_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        client = _stream()
+        if client is None:
+            continue  # Keep draining so the queue can't back up
+
+        try:
+            with client.pipeline(transaction=False) as pipe:
+                for event in batch:
+                    pipe.xadd(
+                        STREAM_KEY_PREFIX + event.session_id,
+                        {
+                            "type": event.type,
+                            "payload": _dumps(event.payload),
+                            "timestamp": event.timestamp.isoformat(),
+                            "priority": event.priority.value,
+                        },
+                        maxlen=STREAM_MAXLEN,
+                        approximate=True,
+                    )
+                pipe.execute()
+        except Exception as e:
+            logger.warning(f"Event stream write failed ({e}); sink disabled")
+            _stream_client = None
+
+
+try:
+    import orjson
+
+    def _dumps(payload: dict[str, Any]) -> bytes:
+        return orjson.dumps(payload, default=str)
+
+except ImportError:
+    import json
+
+    def _dumps(payload: dict[str, Any]) -> bytes:
+        return json.dumps(payload, default=str).encode("utf-8")
 
 
 def log_event(
@@ -44,10 +165,20 @@ def log_event(
     )
     
     with _lock:
-        idx = len(_event_log)
-        _event_log.append(event)
-        _session_index[session_id].append(idx)
-    
+        _recent_events.append(event)
+        _session_events[session_id].append(event)
+        if event_type in _TRANSCRIPT_TYPES:
+            _session_transcripts[session_id].append({
+                "role": "candidate" if event_type == "CANDIDATE_MESSAGE" else "interviewer",
+                "content": payload.get("message", ""),
+                "timestamp": event.timestamp.isoformat(),
+                "type": event_type,
+            })
+
+    # Outside the lock: the sink is network I/O and must not serialize
+    # other threads logging events
+    _sink_event(event)
+
     return event
 
 
@@ -71,35 +202,33 @@ def get_events(
     """
     with _lock:
         if session_id:
-            indices = _session_index.get(session_id, [])
-            events = [_event_log[i] for i in indices]
+            events = list(_session_events.get(session_id, []))
         else:
-            events = list(_event_log)
+            # Global view only covers the last RECENT_EVENTS_MAX events
+            events = list(_recent_events)
     
     # Apply filters
     if event_type:
         events = [e for e in events if e.type == event_type]
-    
+
     if since:
         events = [e for e in events if e.timestamp > since]
-    
-    # Sort by timestamp descending
-    events.sort(key=lambda e: e.timestamp, reverse=True)
-    
+
+    # Both stores append in log order, so newest-first is a plain
+    # reversal -- no per-element timestamp compares
+    events.reverse()
+
     if limit:
         events = events[:limit]
-    
+
     return events
 
 
 def get_session_events(session_id: str) -> list[InterviewEvent]:
     """Get all events for a specific session, chronologically ordered."""
+    # Per-session lists are built in log order; no sort needed
     with _lock:
-        indices = _session_index.get(session_id, [])
-        events = [_event_log[i] for i in indices]
-    
-    events.sort(key=lambda e: e.timestamp)
-    return events
+        return list(_session_events.get(session_id, []))
 
 
 def clear_session(session_id: str) -> int:
@@ -110,16 +239,16 @@ def clear_session(session_id: str) -> int:
         Number of events removed
     """
     with _lock:
-        indices = _session_index.get(session_id, [])
-        count = len(indices)
-        
-        # Mark events as None (can't remove due to index references)
-        # In production, would use soft delete or Redis expiry
-        for idx in indices:
-            _event_log[idx] = None  # type: ignore
-        
-        del _session_index[session_id]
-        
+        count = len(_session_events.pop(session_id, []))
+        _session_transcripts.pop(session_id, None)
+
+    client = _stream()
+    if client is not None:
+        try:
+            client.delete(STREAM_KEY_PREFIX + session_id)
+        except Exception:
+            pass  # Stream will age out via maxlen trimming
+
     return count
 
 
@@ -127,26 +256,17 @@ def get_event_count(session_id: str | None = None) -> int:
     """Get total event count, optionally filtered by session."""
     with _lock:
         if session_id:
-            return len(_session_index.get(session_id, []))
-        return sum(1 for e in _event_log if e is not None)
+            return len(_session_events.get(session_id, []))
+        return sum(len(events) for events in _session_events.values())
 
 
 def get_session_transcript(session_id: str) -> list[dict[str, Any]]:
     """
     Get interview transcript (conversation events only).
     
-    Returns list of messages suitable for display.
+    Returns list of messages suitable for display. Entries are built at
+    log time, so this is a copy of an already-materialized list rather
+    than a walk over the full event log.
     """
-    events = get_session_events(session_id)
-    transcript = []
-    
-    for event in events:
-        if event.type in ("CANDIDATE_MESSAGE", "AGENT_RESPONSE", "HINT_GIVEN"):
-            transcript.append({
-                "role": "candidate" if event.type == "CANDIDATE_MESSAGE" else "interviewer",
-                "content": event.payload.get("message", ""),
-                "timestamp": event.timestamp.isoformat(),
-                "type": event.type,
-            })
-    
-    return transcript
+    with _lock:
+        return list(_session_transcripts.get(session_id, []))
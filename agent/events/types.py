@@ -32,7 +32,13 @@ class EventPriority(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# value -> member table: EventPriority("medium") goes through the enum
+# metaclass __call__ on every decode; a dict probe does the same lookup
+# without it
+_PRIORITY_CACHE: dict[str, EventPriority] = {m.value: m for m in EventPriority}
+
+
+@dataclass(slots=True, frozen=True)
 class InterviewEvent:
     """
     Unified event schema for interview tracking.
@@ -62,11 +68,11 @@ class InterviewEvent:
             session_id=data["session_id"],
             payload=data["payload"],
             timestamp=datetime.fromisoformat(data["timestamp"]),
-            priority=EventPriority(data.get("priority", "medium")),
+            priority=_PRIORITY_CACHE[data.get("priority", "medium")],
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CodeSnapshot:
     """Structured code snapshot payload."""
     code: str
@@ -75,7 +81,7 @@ class CodeSnapshot:
     changed_lines: list[int] | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RunResult:
     """Structured code execution result payload."""
     passed: int
@@ -86,29 +92,28 @@ class RunResult:
     execution_time_ms: float | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InterviewScore:
     """Interview scoring structure."""
     correctness: int  # 0-10
     optimization: int  # 0-10
     communication: int  # 0-10
     problem_solving: int  # 0-10
-    
-    @property
-    def overall(self) -> float:
-        """Calculate overall score."""
-        return (self.correctness + self.optimization + 
-                self.communication + self.problem_solving) / 4
-    
-    @property
-    def recommendation(self) -> str:
-        """Get hiring recommendation based on score."""
-        score = self.overall
-        if score >= 8.5:
-            return "STRONG HIRE"
-        elif score >= 7.0:
-            return "HIRE"
-        elif score >= 5.0:
-            return "LEAN NO HIRE"
+    # Derived once at construction; plain attribute reads afterwards
+    overall: float = field(init=False)
+    recommendation: str = field(init=False)
+
+    def __post_init__(self):
+        # object.__setattr__ because the dataclass is frozen
+        overall = (self.correctness + self.optimization +
+                   self.communication + self.problem_solving) / 4
+        if overall >= 8.5:
+            recommendation = "STRONG HIRE"
+        elif overall >= 7.0:
+            recommendation = "HIRE"
+        elif overall >= 5.0:
+            recommendation = "LEAN NO HIRE"
         else:
-            return "NO HIRE"
+            recommendation = "NO HIRE"
+        object.__setattr__(self, "overall", overall)
+        object.__setattr__(self, "recommendation", recommendation)
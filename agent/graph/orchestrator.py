@@ -5,38 +5,42 @@ LangGraph workflow that coordinates the Interviewer and Fairness agents.
 Manages interview state transitions and session lifecycle.
 """
 
+import threading
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 from langgraph.graph import StateGraph, START, END
 
-from .state import InterviewState, ProblemInfo, create_initial_state, ConversationMessage
+from .state import (
+    InterviewState,
+    ProblemInfo,
+    create_initial_state,
+    ConversationMessage,
+    append_transcript,
+    MAX_CONVERSATION_MESSAGES,
+    MAX_CODE_HISTORY,
+)
 from ..agents.interviewer import InterviewerAgent
 from ..agents.fairness import FairnessAgent
 from ..events import log_event
 
 
-# Global agent instances (cached)
-_interviewer: InterviewerAgent | None = None
-_fairness: FairnessAgent | None = None
-
-
+# Agent singletons: lru_cache(maxsize=1) gives the same
+# create-once-then-reuse behaviour as a module global, with the None
+# check, caching and thread safety handled in C
+@lru_cache(maxsize=1)
 def get_interviewer() -> InterviewerAgent:
     """Get or create interviewer agent instance."""
-    global _interviewer
-    if _interviewer is None:
-        _interviewer = InterviewerAgent()
-    return _interviewer
+    return InterviewerAgent()
 
 
+@lru_cache(maxsize=1)
 def get_fairness_agent() -> FairnessAgent:
     """Get or create fairness agent instance."""
-    global _fairness
-    if _fairness is None:
-        _fairness = FairnessAgent()
-    return _fairness
+    return FairnessAgent()
 
 
-def interviewer_node(state: InterviewState) -> dict[str, Any]:
+async def interviewer_node(state: InterviewState) -> dict[str, Any]:
     """
     LangGraph node for the interviewer agent.
     
@@ -50,71 +54,90 @@ def interviewer_node(state: InterviewState) -> dict[str, Any]:
         submissions = state.get("code_submissions", [])
         test_results = submissions[-1].get("test_results", {}) if submissions else {}
         
-        # Score the solution
-        scores, notes = interviewer.score_solution(state, test_results)
-        
+        # Fused scoring + fairness audit: one LLM roundtrip instead of
+        # score_solution followed by a separate fairness call. The
+        # fairness node still runs next but sees fairness_result set
+        # and returns immediately.
+        scores, notes, fairness_result = await interviewer.score_and_audit(state, test_results)
+
+        # Single clock read for both end-time representations
+        now = datetime.now()
         return {
             "raw_scores": dict(scores),
             "interviewer_notes": notes,
-            "ended_at": datetime.now().isoformat(),
+            "fairness_result": fairness_result,
+            "final_recommendation": fairness_result["recommendation"],
+            "ended_at": now.isoformat(),
+            "ended_at_ts": now.timestamp(),
         }
     
     # Normal flow: present problem if first time
     if not state.get("conversation_history"):
-        message = interviewer.present_problem(state)
-        
+        message = await interviewer.present_problem(state)
+
         return {
             "conversation_history": [ConversationMessage(
                 role="interviewer",
                 content=message,
                 timestamp=datetime.now().isoformat(),
-            )]
+            )],
+            "transcript_text": append_transcript(state, "interviewer", message),
         }
     
     return {}
 
 
-def fairness_node(state: InterviewState) -> dict[str, Any]:
+async def fairness_node(state: InterviewState) -> dict[str, Any]:
     """
     LangGraph node for the fairness agent.
     
     Runs after interview is complete to analyze for bias.
     """
-    fairness = get_fairness_agent()
-    
+    # Already analyzed (e.g. a re-invoked graph): the LLM call is the
+    # expensive part, so don't repeat it for an identical state
+    if state.get("fairness_result"):
+        return {}
+
     # Only run if interview is complete and has scores
     if not state.get("raw_scores"):
         return {}
-    
-    result = fairness.analyze_interview(state)
-    
-    # Determine final recommendation
-    overall = (
-        result["normalized_scores"]["correctness"] +
-        result["normalized_scores"]["optimization"] +
-        result["normalized_scores"]["communication"] +
-        result["normalized_scores"]["problem_solving"]
-    ) / 4
-    
+
+    fairness = get_fairness_agent()
+    result = await fairness.analyze_interview(state)
+
     return {
         "fairness_result": result,
         "final_recommendation": result["recommendation"],
     }
 
 
+# Which counter each interviewer action increments; a miss means the
+# action produced no candidate-facing message (e.g. NONE)
+_ACTION_COUNTERS = {
+    "HINT": "hints_given",
+    "PROMPT": "hints_given",
+    "ENCOURAGE": "encouragements_given",
+}
+
+
+# Routing decisions keyed on (interview_complete, has raw_scores):
+# scored interviews go to fairness, complete-but-unscored loop back to
+# the interviewer, in-progress interviews leave the graph
+_ROUTES = {
+    (True, True): "fairness",
+    (True, False): "interviewer",
+    (False, True): END,
+    (False, False): END,
+}
+
+
 def should_continue(state: InterviewState) -> str:
     """
     Routing function: determines next node based on state.
     """
-    if state.get("interview_complete") and state.get("raw_scores"):
-        # Interview scored, run fairness analysis
-        return "fairness"
-    elif state.get("interview_complete"):
-        # Interview done but not scored yet
-        return "interviewer"
-    else:
-        # Interview still in progress
-        return END
+    return _ROUTES[
+        (bool(state.get("interview_complete")), bool(state.get("raw_scores")))
+    ]
 
 
 def create_interview_graph() -> StateGraph:
@@ -148,6 +171,22 @@ def create_interview_graph() -> StateGraph:
     return graph
 
 
+# Compiled graph singleton: the topology never changes, so the Pregel
+# build/validation cost is paid once, not per finished interview
+_compiled_graph = None
+_graph_lock = threading.Lock()
+
+
+def _get_compiled_graph():
+    """Get or build the compiled interview graph."""
+    global _compiled_graph
+    if _compiled_graph is None:
+        with _graph_lock:
+            if _compiled_graph is None:
+                _compiled_graph = create_interview_graph().compile()
+    return _compiled_graph
+
+
 def run_interview(
     session_id: str,
     candidate_name: str,
@@ -177,67 +216,57 @@ def run_interview(
     return state
 
 
-def process_code_snapshot(
+async def process_code_snapshot(
     state: InterviewState,
     new_code: str,
 ) -> tuple[InterviewState, str | None]:
     """
     Process a code snapshot and get agent response if any.
-    
+
     Returns:
         Tuple of (updated state, agent message or None)
     """
     interviewer = get_interviewer()
-    
-    # Analyze the code
-    action, message = interviewer.analyze_code(state, new_code)
-    
-    # Update state
-    updates: dict[str, Any] = {
-        "code_snapshot": new_code,
-        "last_code_change_at": datetime.now().isoformat(),
-        "code_history": [new_code],
-    }
-    
-    if action == "HINT":
-        updates["hints_given"] = state.get("hints_given", 0) + 1
-        updates["conversation_history"] = [ConversationMessage(
-            role="interviewer",
-            content=message,
-            timestamp=datetime.now().isoformat(),
-        )]
-    elif action == "ENCOURAGE":
-        updates["encouragements_given"] = state.get("encouragements_given", 0) + 1
-        updates["conversation_history"] = [ConversationMessage(
-            role="interviewer",
-            content=message,
-            timestamp=datetime.now().isoformat(),
-        )]
-    elif action == "PROMPT":
-        updates["hints_given"] = state.get("hints_given", 0) + 1
-        updates["conversation_history"] = [ConversationMessage(
+
+    # Analyze the code (non-blocking so the event loop can serve
+    # other candidates during the LLM roundtrip)
+    action, message = await interviewer.analyze_code(state, new_code)
+
+    # Mutate in place: this path runs outside the graph, so nothing needs
+    # the old state object, and building {**state, **updates} shallow-
+    # copied the whole dict and re-materialized both history lists on
+    # every snapshot that reached the agent
+    # One timestamp per snapshot: last_code_change_at and the message
+    # timestamp come from the same clock read
+    now_iso = datetime.now().isoformat()
+
+    state["code_snapshot"] = new_code
+    state["last_code_change_at"] = now_iso
+    code_history = state.setdefault("code_history", [])
+    code_history.append(new_code)
+    if len(code_history) > MAX_CODE_HISTORY:
+        del code_history[:len(code_history) - MAX_CODE_HISTORY]
+
+    counter_key = _ACTION_COUNTERS.get(action)
+    if counter_key:
+        state[counter_key] = state.get(counter_key, 0) + 1
+
+        history = state.setdefault("conversation_history", [])
+        history.append(ConversationMessage(
             role="interviewer",
             content=message,
-            timestamp=datetime.now().isoformat(),
-        )]
-    
-    # Merge updates into state
-    new_state = {**state, **updates}
-    
-    # Handle list concatenation for Annotated fields
-    if "conversation_history" in updates:
-        new_state["conversation_history"] = (
-            state.get("conversation_history", []) + updates["conversation_history"]
-        )
-    if "code_history" in updates:
-        new_state["code_history"] = (
-            state.get("code_history", []) + updates["code_history"]
-        )
-    
-    return new_state, message
+            timestamp=now_iso,
+        ))
+        if len(history) > MAX_CONVERSATION_MESSAGES:
+            del history[:len(history) - MAX_CONVERSATION_MESSAGES]
+
+        # Keep the rolling transcript in sync with conversation_history
+        state["transcript_text"] = append_transcript(state, "interviewer", message)
 
+    return state, message
 
-def finish_interview(state: InterviewState, test_results: dict) -> InterviewState:
+
+async def finish_interview(state: InterviewState, test_results: dict) -> InterviewState:
     """
     Complete the interview, run scoring and fairness analysis.
     
@@ -263,9 +292,15 @@ def finish_interview(state: InterviewState, test_results: dict) -> InterviewStat
     )
     
     # Run full graph to completion
-    graph = create_interview_graph()
-    compiled = graph.compile()
-    
-    result = compiled.invoke(state)
-    
+    result = await _get_compiled_graph().ainvoke(state)
+
+    # Derive the effective scores and overall once; every report fetch,
+    # submit response and websocket completion message reads these
+    fairness_result = result.get("fairness_result") or {}
+    scores = fairness_result.get("normalized_scores", result.get("raw_scores", {}))
+    result["scores_effective"] = scores
+    result["overall_score"] = (
+        round(sum(scores.values()) / len(scores), 1) if scores else 0.0
+    )
+
     return result
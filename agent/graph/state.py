@@ -6,6 +6,7 @@ Defines the state schema for LangGraph interview workflow.
 from typing import TypedDict, Annotated
 from datetime import datetime
 import operator
+import time
 
 
 class ProblemInfo(TypedDict):
@@ -54,6 +55,21 @@ class CodeSubmission(TypedDict):
     passed: bool
 
 
+# Cap on code_history: snapshots arrive every ~1.5s, so an unbounded
+# operator.add reducer would accumulate the full editor contents over a
+# thousand times in a long session. The newest snapshots carry all the
+# signal the agents use; older ones can drop.
+MAX_CODE_HISTORY = 200
+
+
+def bounded_code_history(existing: list[str], new: list[str]) -> list[str]:
+    """Reducer for code_history: append, keeping only the newest entries."""
+    combined = existing + new
+    if len(combined) > MAX_CODE_HISTORY:
+        del combined[:len(combined) - MAX_CODE_HISTORY]
+    return combined
+
+
 class InterviewState(TypedDict, total=False):
     """
     Complete interview state for LangGraph workflow.
@@ -65,18 +81,21 @@ class InterviewState(TypedDict, total=False):
     session_id: str
     candidate_name: str
     started_at: str
+    started_at_ts: float  # Epoch seconds; avoids ISO parsing on status reads
     ended_at: str | None
+    ended_at_ts: float | None
     
     # Problem configuration
     problem: ProblemInfo
     
     # Live coding state
     code_snapshot: str
-    code_history: Annotated[list[str], operator.add]  # Accumulated snapshots
+    code_history: Annotated[list[str], bounded_code_history]  # Recent snapshots
     last_code_change_at: str | None
     
     # Conversation
     conversation_history: Annotated[list[ConversationMessage], operator.add]
+    transcript_text: str  # Rolling "ROLE: content" transcript, appended per turn
     
     # Code submissions
     code_submissions: Annotated[list[CodeSubmission], operator.add]
@@ -96,6 +115,29 @@ class InterviewState(TypedDict, total=False):
     # Final outputs
     final_recommendation: str | None  # STRONG HIRE, HIRE, etc.
     interview_complete: bool
+    # Derived once when the interview finishes so report fetches don't
+    # redo the normalized-vs-raw fallback and the mean per call
+    scores_effective: InterviewScores | None
+    overall_score: float | None
+
+
+# Cap on conversation_history so a chatty session can't grow the state
+# (and every Redis re-serialization of it) without bound; 200 turns is
+# far beyond a 30-minute interview, so trimming only kicks in on abuse
+MAX_CONVERSATION_MESSAGES = 200
+
+
+def append_transcript(state: InterviewState, role: str, content: str) -> str:
+    """
+    Extend the rolling transcript with one turn.
+
+    Keeps transcript construction amortized O(1) per turn instead of
+    rebuilding the full text from conversation_history at every analysis.
+
+    Returns:
+        The new transcript text (caller stores it back on the state).
+    """
+    return state.get("transcript_text", "") + f"{role.upper()}: {content}\n"
 
 
 def create_initial_state(
@@ -108,12 +150,15 @@ def create_initial_state(
         session_id=session_id,
         candidate_name=candidate_name,
         started_at=datetime.now().isoformat(),
+        started_at_ts=time.time(),
         ended_at=None,
+        ended_at_ts=None,
         problem=problem,
         code_snapshot=problem["starter_code"],
         code_history=[],
         last_code_change_at=None,
         conversation_history=[],
+        transcript_text="",
         code_submissions=[],
         current_analysis=None,
         hints_given=0,
@@ -0,0 +1,37 @@
+"""
+ARETE Shared HTTP Client
+Persistent HTTP/2 connection pool for OpenRouter LLM calls.
+
+Both agents route their requests through one shared httpx client so the
+TLS handshake is amortized across calls and concurrent interviews
+multiplex over the same connections instead of each opening their own
+HTTP/1.1 pool.
+"""
+
+import httpx
+
+
+_async_client: httpx.AsyncClient | None = None
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the shared pooled async HTTP client, creating it on first use."""
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(
+                max_keepalive_connections=64,
+                max_connections=256,
+            ),
+        )
+    return _async_client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (called from the app shutdown hook)."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
@@ -10,17 +10,59 @@ Cost: ~$0.10/min
 import asyncio
 import aiohttp
 import logging
-from typing import Optional, AsyncGenerator
-import json
+from typing import Optional, AsyncGenerator, AsyncIterator
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 DID_API_BASE = "https://api.d-id.com"
 
 
+# Process-wide session pool keyed by auth header: avatar instances come
+# and go per interview, but the TCP+TLS connections underneath should
+# not — a fresh ClientSession per avatar paid a handshake per session
+_SESSION_CACHE: dict[str, aiohttp.ClientSession] = {}
+
+
+def _pooled_session(auth_header: str) -> aiohttp.ClientSession:
+    """Get or create the shared ClientSession for an API credential."""
+    session = _SESSION_CACHE.get(auth_header)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=30,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            ),
+            headers={
+                "Authorization": auth_header,
+                "Content-Type": "application/json",
+            },
+            # aiohttp's json= bodies go through stdlib json.dumps by
+            # default; orjson is faster for the per-utterance payloads
+            json_serialize=lambda obj: orjson.dumps(obj).decode("utf-8"),
+        )
+        _SESSION_CACHE[auth_header] = session
+    return session
+
+
+async def close_avatar_sessions() -> None:
+    """Close all pooled avatar sessions (call at app shutdown)."""
+    for session in _SESSION_CACHE.values():
+        if not session.closed:
+            await session.close()
+    _SESSION_CACHE.clear()
+
+
 class DIDAvatar:
     """D-ID streaming avatar for real-time lip-sync video."""
 
+    # Invariant config block shared across per-utterance payloads; only
+    # read during serialization, so one instance serves every call
+    _STITCH_CONFIG = {"stitch": True}
+
     def __init__(self, api_key: str, source_image_url: str):
         """
         Initialize D-ID avatar.
@@ -33,17 +75,13 @@ class DIDAvatar:
         self.source_image_url = source_image_url
         self.stream_id: Optional[str] = None
         self.session_id: Optional[str] = None
-        self._session: Optional[aiohttp.ClientSession] = None
+        # Background sends in flight, bounded so a burst of utterances
+        # can't pile up unlimited concurrent POSTs
+        self._inflight: set[asyncio.Task] = set()
+        self._send_sem = asyncio.Semaphore(4)
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                headers={
-                    "Authorization": f"Basic {self.api_key}",
-                    "Content-Type": "application/json",
-                }
-            )
-        return self._session
+        return _pooled_session(f"Basic {self.api_key}")
 
     async def create_stream(self) -> dict:
         """
@@ -101,9 +139,7 @@ class DIDAvatar:
                 "type": "audio",
                 "audio_url": audio_url,
             },
-            "config": {
-                "stitch": True,
-            },
+            "config": self._STITCH_CONFIG,
             "session_id": self.session_id,
         }
 
@@ -142,9 +178,7 @@ class DIDAvatar:
                     "voice_id": voice_id,
                 },
             },
-            "config": {
-                "stitch": True,
-            },
+            "config": self._STITCH_CONFIG,
             "session_id": self.session_id,
         }
 
@@ -159,6 +193,35 @@ class DIDAvatar:
             data = await resp.json()
             return data
 
+    async def _send_gated(self, coro) -> Optional[dict]:
+        """Run a send under the concurrency gate, logging failures."""
+        async with self._send_sem:
+            try:
+                return await coro
+            except Exception as e:
+                logger.warning(f"D-ID background send failed: {e}")
+                return None
+
+    def _spawn_send(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(self._send_gated(coro))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+        return task
+
+    def send_audio_nowait(self, audio_url: str) -> asyncio.Task:
+        """
+        Schedule send_audio without waiting for D-ID's response.
+
+        The lip-synced video reaches the client over WebRTC regardless,
+        so callers that don't need the response metadata can keep the
+        interview loop moving instead of blocking on the POST round-trip.
+        """
+        return self._spawn_send(self.send_audio(audio_url))
+
+    def send_text_nowait(self, text: str, voice_id: str = "en-US-JennyNeural") -> asyncio.Task:
+        """Schedule send_text without waiting for D-ID's response."""
+        return self._spawn_send(self.send_text(text, voice_id))
+
     async def set_answer(self, sdp_answer: str) -> None:
         """
         Complete WebRTC handshake by sending SDP answer.
@@ -202,8 +265,24 @@ class DIDAvatar:
                 error = await resp.text()
                 logger.warning(f"D-ID ICE candidate failed: {error}")
 
+    def add_ice_candidate_nowait(self, candidate: dict) -> asyncio.Task:
+        """
+        Schedule add_ice_candidate without awaiting the POST.
+
+        Trickle ICE produces a burst of candidates during the handshake;
+        awaiting each POST serializes them at one round-trip apiece. The
+        D-ID endpoint takes one candidate per request, so they can't be
+        coalesced into fewer calls, but queuing them through the send
+        gate lets them overlap on the pooled connections instead.
+        """
+        return self._spawn_send(self.add_ice_candidate(candidate))
+
     async def close(self) -> None:
         """Close the streaming session."""
+        # Let background sends settle before tearing the stream down
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
         if self.stream_id:
             session = await self._get_session()
             try:
@@ -214,10 +293,8 @@ class DIDAvatar:
                     logger.info(f"D-ID stream closed: {resp.status}")
             except Exception as e:
                 logger.warning(f"Failed to close D-ID stream: {e}")
-
-        if self._session:
-            await self._session.close()
-            self._session = None
+        # The pooled ClientSession stays open for other avatars; it is
+        # closed once at shutdown via close_avatar_sessions()
 
 
 # Alternative: Simli for lower latency
@@ -232,17 +309,9 @@ class SimliAvatar:
     def __init__(self, api_key: str, face_id: str):
         self.api_key = api_key
         self.face_id = face_id
-        self._session: Optional[aiohttp.ClientSession] = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                }
-            )
-        return self._session
+        return _pooled_session(f"Bearer {self.api_key}")
 
     async def start_session(self) -> dict:
         """Start a Simli streaming session."""
@@ -270,24 +339,42 @@ class SimliAvatar:
         pass
 
     async def close(self) -> None:
-        if self._session:
-            await self._session.close()
+        # The pooled ClientSession is shared; closed via close_avatar_sessions()
+        pass
+
+
+# Upload body is streamed in fixed chunks so multi-MB TTS output is not
+# held in flight all at once and aiohttp can use chunked transfer
+_UPLOAD_CHUNK_BYTES = 64 * 1024
+
+
+async def _iter_chunks(data: bytes) -> AsyncGenerator[bytes, None]:
+    for i in range(0, len(data), _UPLOAD_CHUNK_BYTES):
+        yield data[i:i + _UPLOAD_CHUNK_BYTES]
 
 
 # Simple helper to upload audio to a temporary URL
-async def upload_audio_temp(audio_bytes: bytes, content_type: str = "audio/mpeg") -> str:
+async def upload_audio_temp(
+    audio_source: AsyncIterator[bytes] | bytes,
+    content_type: str = "audio/mpeg",
+) -> str:
     """
-    Upload audio bytes to a temporary hosting service.
+    Upload audio to a temporary hosting service.
     Returns a public URL that D-ID can access.
 
+    Accepts either full bytes or an async iterator of chunks (e.g. a
+    streaming TTS response), so upload can overlap with generation.
+
     For production, use S3, GCS, or similar.
     For hackathon, you can use transfer.sh or similar.
     """
+    data = _iter_chunks(audio_source) if isinstance(audio_source, (bytes, bytearray)) else audio_source
+
     async with aiohttp.ClientSession() as session:
         # Using transfer.sh as a quick solution
         async with session.put(
             "https://transfer.sh/audio.mp3",
-            data=audio_bytes,
+            data=data,
             headers={"Content-Type": content_type},
         ) as resp:
             if resp.status == 200:
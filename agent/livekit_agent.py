@@ -10,11 +10,15 @@ Run with:
 
 import asyncio
 import logging
-from typing import Callable, Awaitable, Annotated
+import logging.handlers
+import queue
+import re
+from functools import lru_cache
+from typing import Callable, Awaitable, Annotated, AsyncIterable
 from datetime import datetime
 
 from dotenv import load_dotenv
-import json
+import orjson
 import livekit.rtc as rtc
 from livekit.agents import cli, llm, JobContext, JobProcess, WorkerOptions
 from livekit.agents.voice import Agent, AgentSession, room_io
@@ -27,14 +31,27 @@ load_dotenv()
 from .config import get_settings
 from .graph.state import ProblemInfo, create_initial_state, ConversationMessage
 from .events import log_event
-from .api.routes import PROBLEM_BANK, _execute_code
+from .api.routes import PROBLEM_BANK, _execute_code_async
 
 
+# Log records are handed to a queue and written by a listener thread:
+# a blocking stderr write inside the asyncio loop (per turn, per plugin)
+# is tail-latency jitter on live voice sessions
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    fmt="%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%H:%M:%S",
+))
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(message)s",
-    datefmt="%H:%M:%S",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_handler, respect_handler_level=True
 )
+_log_listener.start()
+
 logger = logging.getLogger("arete-agent")
 
 
@@ -81,23 +98,61 @@ ALWAYS end with a clear question or affirmation to invite the candidate to speak
 """
 
 
+# The prompt asks the LLM to avoid code syntax, but compliance is
+# probabilistic; this post-filter is the deterministic backstop. A
+# translate table is a single C-level pass per chunk -- no per-char
+# Python loop on the TTS hot path.
+_TTS_CHAR_MAP = str.maketrans({
+    "[": " ", "]": " ", "{": " ", "}": " ",
+    "(": " ", ")": " ", "<": " ", ">": " ",
+    "_": " ", "`": " ", "*": " ", "#": " ",
+    "=": " equals ",
+})
+_TTS_WS_RE = re.compile(r"\s{2,}")
+
+
+def tts_text_filter(text: str) -> str:
+    """Strip code symbols the TTS engine mispronounces."""
+    return _TTS_WS_RE.sub(" ", text.translate(_TTS_CHAR_MAP))
+
+
+@lru_cache(maxsize=32)
+def _build_instructions(problem_id: str) -> str:
+    """Format the interviewer prompt for a problem, memoized by id.
+
+    The problem bank is small and static, so every session for the same
+    problem reuses one formatted string instead of re-rendering it at
+    session start.
+    """
+    problem = PROBLEM_BANK.get(problem_id, PROBLEM_BANK["two_sum"])
+    return INTERVIEWER_INSTRUCTIONS.format(
+        problem_title=problem["title"],
+        difficulty=problem["difficulty"],
+        problem_prompt=problem["prompt"],
+        constraints="\n".join(f"- {c}" for c in problem.get("constraints", [])),
+        optimal_approach=problem["optimal_approach"],
+    )
+
+
 class InterviewerAgent(Agent):
     """Custom interview agent with code execution capabilities."""
 
     def __init__(self, problem: ProblemInfo, state: dict, on_disconnect: Callable[[], Awaitable[None]] = None):
         super().__init__(
-            instructions=INTERVIEWER_INSTRUCTIONS.format(
-                problem_title=problem["title"],
-                difficulty=problem["difficulty"],
-                problem_prompt=problem["prompt"],
-                constraints="\n".join(f"- {c}" for c in problem.get("constraints", [])),
-                optimal_approach=problem["optimal_approach"],
-            )
+            instructions=_build_instructions(problem["id"])
         )
         self.problem = problem
         self.state = state
         self.on_disconnect = on_disconnect
 
+    async def tts_node(self, text: AsyncIterable[str], model_settings):
+        """Filter code symbols out of LLM output before synthesis."""
+        async def _filtered() -> AsyncIterable[str]:
+            async for chunk in text:
+                yield tts_text_filter(chunk)
+
+        return super().tts_node(_filtered(), model_settings)
+
     async def on_enter(self):
         """Called when agent becomes active - send greeting."""
         logger.info("Agent on_enter called - generating greeting...")
@@ -113,9 +168,19 @@ class InterviewerAgent(Agent):
         return "I will end the interview now. Goodbye!"
 
     async def _disconnect_later(self):
-        """Waits for speech to finish then disconnects."""
+        """Waits for the farewell to finish playing, then disconnects."""
         logger.info("Waiting for final speech...")
-        await asyncio.sleep(5) # Allow 5s for TTS
+        # The farewell reply is scheduled after the tool returns, so give
+        # it a beat to enter the speech queue before watching playout
+        await asyncio.sleep(0.5)
+        speech = self.session.current_speech
+        if speech is not None:
+            try:
+                # Drain on the actual playout event instead of a flat 5s
+                # sleep; the timeout is only the stuck-TTS escape hatch
+                await asyncio.wait_for(speech.wait_for_playout(), timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning("Timed out waiting for farewell playout")
         logger.info("Disconnecting...")
         if self.on_disconnect:
             await self.on_disconnect()
@@ -128,10 +193,11 @@ class InterviewerAgent(Agent):
         if not code:
             return "No code found in the editor."
         try:
-            # Run in executor to avoid blocking the event loop
-            loop = asyncio.get_running_loop()
-            results = await loop.run_in_executor(None, _execute_code, code, self.problem)
-            
+            # Run in the persistent sandbox worker pool: pre-forked
+            # workers with the harness already imported, hard timeout,
+            # and the candidate code never executes in this process
+            results = await _execute_code_async(code, self.problem)
+
             # Format as natural language for the LLM to read/summarize
             passed = results["passed"]
             total = results["total"]
@@ -153,9 +219,33 @@ class InterviewerAgent(Agent):
 
 def prewarm(proc: JobProcess):
     """Prewarm resources for faster startup."""
+    settings = get_settings()
     proc.userdata["vad"] = silero.VAD.load(
-        min_speech_duration=0.05,  # Def: 0.05 - highly sensitive
-        min_silence_duration=0.2, # Def: 0.55 - much faster end of speech
+        min_speech_duration=settings.vad_min_speech_duration,   # Def: 0.05
+        min_silence_duration=settings.vad_min_silence_duration, # Def: 0.55 - much faster end of speech
+        activation_threshold=settings.vad_activation_threshold, # Def: 0.5
+    )
+
+    # Build the TTS plugin once per worker process: constructing it per
+    # job paid a fresh ElevenLabs connection handshake on the first
+    # utterance of every interview. streaming_latency=3 favours
+    # time-to-first-audio over prosody lookahead.
+    if not settings.elevenlabs_api_key:
+        logger.warning("WARNING: ELEVENLABS_API_KEY is not set. Using fallback/default voice!")
+    else:
+        logger.info(f"Using ElevenLabs TTS with voice: {settings.elevenlabs_voice_id or 'default'}")
+
+    # Render the interviewer prompt for every bank problem now, so the
+    # first session of each problem hits the memoized string instead of
+    # formatting it on the session-start path
+    for problem_id in PROBLEM_BANK:
+        _build_instructions(problem_id)
+
+    proc.userdata["tts"] = elevenlabs.TTS(
+        api_key=settings.elevenlabs_api_key or None,
+        voice_id=settings.elevenlabs_voice_id or "21m00Tcm4TlvDq8ikWAM",  # Defaults to Rachel
+        model="eleven_turbo_v2_5",  # Use Turbo for lowest latency (~250ms)
+        streaming_latency=3,
     )
 
 
@@ -184,46 +274,59 @@ async def entrypoint(ctx: JobContext):
     # Connect to room
     await ctx.connect()
     
-    # Config for OpenRouter (using OpenAI plugin)
-
-
+    # Config for OpenRouter (using OpenAI plugin). The voice loop prefers
+    # the low-TTFT voice_model override when configured: first-token time
+    # is the largest slice of per-turn voice latency, and a smaller
+    # streaming-first model keeps it in the low hundreds of ms. Low
+    # temperature keeps the short conversational turns on-script.
     llm_plugin = openai.LLM(
-        base_url=settings.openrouter_base_url,
+        base_url=settings.voice_model_base_url or settings.openrouter_base_url,
         api_key=settings.openrouter_api_key,
-        model=settings.interviewer_model,
+        model=settings.voice_model or settings.interviewer_model,
+        temperature=0.3,
     )
 
-    # Config for STT (Deepgram)
+    # Config for STT (Deepgram). The conversationalai variant of Nova-2
+    # is tuned for dialogue rather than long-form transcription, and
+    # interim results let the session endpoint on partial transcripts
+    # instead of waiting for finals. Formatting passes (smart_format,
+    # punctuate) only add latency here -- the text goes straight to the
+    # LLM, never to a display.
     stt_plugin = deepgram.STT(
         api_key=settings.deepgram_api_key or None,
-        model="nova-2-general",
+        model="nova-2-conversationalai",
+        language="en-US",
+        interim_results=True,
+        smart_format=False,
+        punctuate=False,
+        endpointing_ms=150,
     )
 
-    # Config for TTS (ElevenLabs)
-    if not settings.elevenlabs_api_key:
-        logger.warning("WARNING: ELEVENLABS_API_KEY is not set. Using fallback/default voice!")
-    else:
-        logger.info(f"Using ElevenLabs TTS with voice: {settings.elevenlabs_voice_id or 'default'}")
+    # TTS (ElevenLabs): prewarmed per worker process, see prewarm()
+    tts_plugin = ctx.proc.userdata["tts"]
 
-    tts_plugin = elevenlabs.TTS(
-        api_key=settings.elevenlabs_api_key or None,
-        voice_id=settings.elevenlabs_voice_id or "21m00Tcm4TlvDq8ikWAM",  # Defaults to Rachel
-        model="eleven_turbo_v2_5",  # Use Turbo for lowest latency (~250ms)
-    )
-    
     # Initialize AgentSession with Plugins
     session = AgentSession(
         vad=ctx.proc.userdata["vad"],
         stt=stt_plugin,
         llm=llm_plugin,
         tts=tts_plugin,
+        # Barge-in triggers on a short burst of speech rather than the
+        # library default, so interruptions land mid-sentence instead of
+        # after the agent has finished the thought
+        min_interruption_duration=settings.min_interruption_duration,
+        # Start the LLM on the interim transcript instead of waiting for
+        # endpointing + the final; the session cancels and regenerates if
+        # the finalized transcript differs, so the common case overlaps
+        # LLM time-to-first-token with the tail of the user's turn
+        preemptive_generation=True,
     )
 
     # --- TRANSCRIPT BROADCASTING ---
     async def broadcast_transcript(role: str, text: str):
         """Send transcript update to frontend via data channel."""
         try:
-            payload = json.dumps({
+            payload = orjson.dumps({
                 "type": "transcript",
                 "role": role,
                 "text": text,
@@ -13,7 +13,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import get_settings
-from .api.routes import router as api_router
+from .http import close_http_client
+from .api.routes import router as api_router, close_anthropic_client, warm_executor
 from .api.websocket import websocket_router
 
 
@@ -73,11 +74,16 @@ async def lifespan(app: FastAPI):
     
     logger.info(f"Using interviewer model: {settings.interviewer_model}")
     logger.info(f"Using fairness model: {settings.fairness_model}")
-    
+
+    # Pre-warm the sandbox worker pool so the first /run doesn't pay fork cost
+    warm_executor()
+
     yield
-    
+
     # Shutdown
     logger.info("Shutting down ARETE Agent Core...")
+    close_anthropic_client()
+    await close_http_client()
 
 
 # Create FastAPI app
@@ -160,4 +166,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
+        # uvloop + httptools replace the stdlib event loop and h11 parser,
+        # shaving per-request CPU on every handler
+        loop="uvloop",
+        http="httptools",
     )
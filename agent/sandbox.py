@@ -0,0 +1,215 @@
+"""
+ARETE Sandbox Worker
+
+Code that runs inside the judging worker processes, kept in its own
+module with no FastAPI/LangGraph/LLM imports. The worker pool uses the
+forkserver start method preloaded with just this module, so each worker
+carries only the judging code instead of a copy of the whole web app.
+"""
+
+import ast
+import hashlib
+import os
+from collections import Counter, OrderedDict
+from types import CodeType
+from typing import Any, Callable
+
+
+# =============================================================================
+# Answer Checkers
+# =============================================================================
+
+def _check_exact(actual: Any, expected: Any) -> bool:
+    """Checker for problems with a single canonical answer."""
+    return actual == expected
+
+
+def _check_unordered(actual: Any, expected: Any) -> bool:
+    """Checker for flat-list answers where element order doesn't matter."""
+    if actual == expected:
+        return True
+    if not isinstance(actual, list) or len(actual) != len(expected):
+        return False
+    return Counter(actual) == Counter(expected)
+
+
+def _check_unordered_nested(actual: Any, expected: Any) -> bool:
+    """Checker for list-of-list answers where outer order doesn't matter."""
+    if actual == expected:
+        return True
+    if not isinstance(actual, list) or len(actual) != len(expected):
+        return False
+    try:
+        return sorted(map(tuple, actual)) == sorted(map(tuple, expected))
+    except TypeError:
+        return False
+
+
+def _check_generic(actual: Any, expected: Any) -> bool:
+    """Fallback checker for problems without a specialized comparison."""
+    if actual == expected:
+        return True
+    if (
+        isinstance(expected, list)
+        and isinstance(actual, list)
+        and len(actual) == len(expected)
+    ):
+        # Hashable elements compare through C-backed counters with no
+        # string conversion; unhashable (nested) ones fall back to repr
+        try:
+            return Counter(actual) == Counter(expected)
+        except TypeError:
+            return Counter(map(repr, actual)) == Counter(map(repr, expected))
+    return False
+
+
+# Answer shapes are known per problem, so each gets a specialized checker
+# and the hot test loop skips the generic isinstance/repr branch. All are
+# module-level functions so they pickle cleanly into the worker pool.
+_PROBLEM_CHECKERS: dict[str, Callable[[Any, Any], bool]] = {
+    "two_sum": _check_unordered,
+    "merge_intervals": _check_unordered_nested,
+    "valid_parentheses": _check_exact,
+}
+
+
+def _checker_for(problem: dict[str, Any]) -> Callable[[Any, Any], bool]:
+    """Pick the comparison function for a problem."""
+    return _PROBLEM_CHECKERS.get(problem["id"], _check_generic)
+
+
+# =============================================================================
+# Candidate Code Execution
+# =============================================================================
+
+# Compiled candidate code keyed by SHA1, LRU-bounded. Lives in the pool
+# workers, which persist across tasks, so the repeated Run/Run/Submit
+# cycle on unchanged code skips re-parsing and re-compiling the source.
+_CODE_CACHE_MAX_ENTRIES = 256
+_code_cache: OrderedDict[bytes, tuple[str | None, CodeType]] = OrderedDict()
+
+
+def _compile_candidate(code: str) -> tuple[str | None, CodeType]:
+    """Get the (function name, code object) for candidate source, cached."""
+    digest = hashlib.sha1(code.encode()).digest()
+    cached = _code_cache.get(digest)
+    if cached is not None:
+        _code_cache.move_to_end(digest)
+        return cached
+
+    tree = ast.parse(code)
+    func_name = next(
+        (
+            node.name
+            for node in tree.body
+            if isinstance(node, ast.FunctionDef) and not node.name.startswith("_")
+        ),
+        None,
+    )
+    compiled = (func_name, compile(tree, "<candidate>", "exec"))
+    _code_cache[digest] = compiled
+    while len(_code_cache) > _CODE_CACHE_MAX_ENTRIES:
+        _code_cache.popitem(last=False)
+    return compiled
+
+
+def _worker_entry(
+    code: str,
+    test_cases: list[dict],
+    check: Callable[[Any, Any], bool] = _check_generic,
+    stop_on_first_fail: bool = False,
+) -> dict[str, Any]:
+    """
+    Run candidate code against test cases inside a pool worker.
+
+    With stop_on_first_fail the loop exits at the first failing case --
+    iterative /run calls only need to know that something failed, while
+    final submissions always run the full suite.
+    """
+    # CPU ceiling so runaway candidate code dies even if the parent's
+    # timeout handling is delayed. Workers are long-lived, so the soft
+    # limit is set relative to CPU already consumed by earlier tasks.
+    try:
+        import resource
+        used = resource.getrusage(resource.RUSAGE_SELF)
+        cpu_seconds = int(used.ru_utime + used.ru_stime)
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds + 5, hard))
+    except (ImportError, ValueError, OSError):
+        pass  # Not available on all platforms; parent timeout still applies
+
+    result = {
+        "passed": 0,
+        "failed": 0,
+        "total": len(test_cases),
+        "details": [],
+        "stderr": None,
+    }
+
+    try:
+        # Grab the first top-level function from the AST instead of
+        # scanning every symbol the exec namespace picks up; parse and
+        # compile results are memoized across the Run/Submit cycle.
+        func_name, code_obj = _compile_candidate(code)
+
+        if not func_name:
+            result["stderr"] = "No function defined"
+            return result
+
+        namespace: dict[str, Any] = {}
+        exec(code_obj, namespace)
+        func = namespace[func_name]
+
+        # Run test cases
+        for i, tc in enumerate(test_cases):
+            try:
+                # Handle different input formats
+                if isinstance(tc["input"], dict):
+                    actual = func(**tc["input"])
+                else:
+                    actual = func(tc["input"])
+
+                expected = tc["expected"]
+
+                # Per-problem comparison, specialized at submit time
+                passed = check(actual, expected)
+
+                if passed:
+                    result["passed"] += 1
+                else:
+                    result["failed"] += 1
+
+                result["details"].append({
+                    "case": i + 1,
+                    "passed": passed,
+                    "input": tc["input"],
+                    "expected": expected,
+                    "actual": actual,
+                })
+            except Exception as e:
+                result["failed"] += 1
+                result["details"].append({
+                    "case": i + 1,
+                    "passed": False,
+                    "input": tc["input"],
+                    "error": str(e),
+                })
+            if stop_on_first_fail and result["failed"]:
+                break
+    except Exception as e:
+        result["stderr"] = str(e)
+
+    return result
+
+
+def _pin_worker(counter, cores: list[int]) -> None:
+    """Pool initializer: pin this worker to its round-robin core."""
+    if not cores:
+        return
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    try:
+        os.sched_setaffinity(0, {cores[index % len(cores)]})
+    except (AttributeError, OSError):
+        pass
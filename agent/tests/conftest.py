@@ -2,9 +2,76 @@
 Pytest configuration for ARETE Agent Backend tests.
 """
 
+import copy
 import sys
+import uuid
 from pathlib import Path
 
+import pytest
+
 # Add project root to path so imports work
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
+
+
+def pytest_configure(config):
+    """Warm the heavy import chain once per process.
+
+    LangGraph, the OpenAI SDK and route registration dominate first-test
+    latency; importing here pays that once per pytest process (and per
+    xdist worker), so every test -- including the import tests -- hits
+    the module cache.
+    """
+    # agent.main first: it pulls the rest in dependency order, whereas
+    # importing agent.agents directly trips the agents<->orchestrator
+    # import cycle
+    import agent.main  # noqa: F401
+    import agent.agents  # noqa: F401
+    import agent.config  # noqa: F401
+    import agent.events  # noqa: F401
+    import agent.graph  # noqa: F401
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Shared test client for the FastAPI app.
+
+    Session-scoped: importing agent.main pulls in LangGraph, the OpenAI
+    SDK and route registration, so the app and client are built once per
+    run instead of once per test. Tests only issue requests through it
+    and keep their state in per-test session ids, so sharing is safe.
+    """
+    from fastapi.testclient import TestClient
+
+    from agent.main import app
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def _problem_bank_snapshot():
+    """Pristine copy of PROBLEM_BANK, taken once per session."""
+    from agent.api.routes import PROBLEM_BANK
+
+    return copy.deepcopy(PROBLEM_BANK)
+
+
+@pytest.fixture
+def problem_bank(_problem_bank_snapshot, monkeypatch):
+    """A fresh PROBLEM_BANK the test may mutate freely.
+
+    Patches the module global for the duration of the test, so tests
+    that edit problems can't leak changes into other tests (or other
+    xdist reruns of the same worker). Read-only tests can keep using
+    the live bank directly.
+    """
+    fresh = copy.deepcopy(_problem_bank_snapshot)
+    monkeypatch.setattr("agent.api.routes.PROBLEM_BANK", fresh)
+    return fresh
+
+
+@pytest.fixture
+def session_id():
+    """A unique session id per test, so event-store entries never
+    collide across tests, reruns, or xdist workers."""
+    return f"test-{uuid.uuid4()}"
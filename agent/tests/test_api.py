@@ -3,22 +3,19 @@ ARETE Agent Backend - Test Suite
 
 Pytest tests for the FastAPI endpoints and core functionality.
 Run with: pytest agent/tests/ -v
+Parallel: pytest agent/tests/ -n auto --dist load  (requires pytest-xdist)
+
+Tests use per-test session ids and never share mutable state across
+classes, so they are safe to distribute across xdist workers.
 """
 
 import pytest
-from fastapi.testclient import TestClient
-
-from agent.main import app
-
 
-# =============================================================================
-# Test Client Fixture
-# =============================================================================
+from agent.api.routes import PROBLEM_BANK, _execute_code
+from agent.events import get_session_events, get_session_transcript, log_event
+from agent.graph.state import ProblemInfo, create_initial_state
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+# The `client` fixture is session-scoped and lives in conftest.py
 
 
 # =============================================================================
@@ -91,12 +88,10 @@ class TestProblemsEndpoint:
 class TestInterviewEndpoints:
     """Tests for interview session management."""
     
-    @pytest.mark.skipif(
-        not __import__('os').environ.get('OPENROUTER_API_KEY'),
-        reason="Requires OPENROUTER_API_KEY to be set"
-    )
     def test_start_interview_success(self, client):
-        """Test starting a new interview session (requires API key)."""
+        """Test starting a new interview session."""
+        # No API key needed: session creation makes no LLM call (the
+        # greeting is delivered by the voice agent, not this endpoint)
         response = client.post(
             "/api/v1/interviews",
             json={"candidate_name": "Test User", "problem_id": "two_sum"}
@@ -105,7 +100,7 @@ class TestInterviewEndpoints:
         data = response.json()
         assert "session_id" in data
         assert data["candidate_name"] == "Test User"
-        assert data["problem_title"] == "Two Sum"
+        assert data["problem"]["title"] == "Two Sum"
     
     def test_start_interview_invalid_problem(self, client):
         """Test starting interview with invalid problem ID."""
@@ -133,17 +128,7 @@ class TestInterviewEndpoints:
 # Code Execution Tests
 # =============================================================================
 
-class TestCodeExecution:
-    """Tests for code execution functionality."""
-    
-    def test_code_execution_helper(self):
-        """Test the internal code execution helper."""
-        from agent.api.routes import _execute_code, PROBLEM_BANK
-        
-        problem = PROBLEM_BANK["two_sum"]
-        
-        # Test correct solution
-        correct_code = """
+CORRECT_CODE = """
 def twoSum(nums, target):
     seen = {}
     for i, n in enumerate(nums):
@@ -151,36 +136,48 @@ def twoSum(nums, target):
             return [seen[target - n], i]
         seen[n] = i
 """
-        result = _execute_code(correct_code, problem)
-        assert result["passed"] == 3
-        assert result["failed"] == 0
-        assert result["stderr"] is None
-    
-    def test_code_execution_wrong_answer(self):
-        """Test code execution with wrong answer."""
-        from agent.api.routes import _execute_code, PROBLEM_BANK
-        
-        problem = PROBLEM_BANK["two_sum"]
-        
-        wrong_code = """
+
+WRONG_CODE = """
 def twoSum(nums, target):
     return [0, 0]  # Always wrong
 """
-        result = _execute_code(wrong_code, problem)
-        assert result["failed"] > 0
-    
-    def test_code_execution_syntax_error(self):
-        """Test code execution with syntax error."""
-        from agent.api.routes import _execute_code, PROBLEM_BANK
-        
-        problem = PROBLEM_BANK["two_sum"]
-        
-        bad_code = """
+
+SYNTAX_ERROR_CODE = """
 def twoSum(nums, target)
     return []  # Missing colon
 """
-        result = _execute_code(bad_code, problem)
-        assert result["stderr"] is not None
+
+
+@pytest.fixture(scope="module")
+def two_sum_problem():
+    """The Two Sum problem definition, shared across execution tests."""
+    return PROBLEM_BANK["two_sum"]
+
+
+class TestCodeExecution:
+    """Tests for code execution functionality."""
+
+    @pytest.mark.parametrize(
+        ("code", "expected_passed", "expect_failures", "expect_stderr"),
+        [
+            pytest.param(CORRECT_CODE, 3, False, False, id="correct"),
+            pytest.param(WRONG_CODE, None, True, False, id="wrong_answer"),
+            pytest.param(SYNTAX_ERROR_CODE, None, False, True, id="syntax_error"),
+        ],
+    )
+    def test_code_execution(
+        self, two_sum_problem, code, expected_passed, expect_failures, expect_stderr
+    ):
+        """Test the internal code execution helper across outcomes."""
+        result = _execute_code(code, two_sum_problem)
+        if expected_passed is not None:
+            assert result["passed"] == expected_passed
+            assert result["failed"] == 0
+            assert result["stderr"] is None
+        if expect_failures:
+            assert result["failed"] > 0
+        if expect_stderr:
+            assert result["stderr"] is not None
 
 
 # =============================================================================
@@ -190,42 +187,32 @@ def twoSum(nums, target)
 class TestEventSystem:
     """Tests for the event logging system."""
     
-    def test_log_event(self):
+    def test_log_event(self, session_id):
         """Test logging an event."""
-        from agent.events import log_event, get_session_events
-        
         event = log_event(
             "CODE_SNAPSHOT",
-            "test-session-123",
+            session_id,
             {"code": "print('hello')"}
         )
-        
+
         assert event.type == "CODE_SNAPSHOT"
-        assert event.session_id == "test-session-123"
+        assert event.session_id == session_id
         assert event.payload["code"] == "print('hello')"
-    
-    def test_get_session_events(self):
+
+    def test_get_session_events(self, session_id):
         """Test retrieving events for a session."""
-        from agent.events import log_event, get_session_events
-        
-        session_id = "test-session-456"
-        
         # Log multiple events
         log_event("SESSION_START", session_id, {"problem": "two_sum"})
         log_event("CODE_SNAPSHOT", session_id, {"code": "def foo(): pass"})
-        
+
         events = get_session_events(session_id)
         assert len(events) >= 2
-    
-    def test_get_session_transcript(self):
+
+    def test_get_session_transcript(self, session_id):
         """Test getting interview transcript."""
-        from agent.events import log_event, get_session_transcript
-        
-        session_id = "test-session-789"
-        
         log_event("AGENT_RESPONSE", session_id, {"message": "Hello!"})
         log_event("CANDIDATE_MESSAGE", session_id, {"message": "Hi there"})
-        
+
         transcript = get_session_transcript(session_id)
         assert isinstance(transcript, list)
 
@@ -239,8 +226,6 @@ class TestInterviewState:
     
     def test_create_initial_state(self):
         """Test creating initial interview state."""
-        from agent.graph.state import create_initial_state, ProblemInfo
-        
         problem = ProblemInfo(
             id="test",
             title="Test Problem",
@@ -1,30 +1,52 @@
+"""
+OpenRouter connectivity smoke test.
+
+Marked slow and skipped without OPENROUTER_API_KEY, so a plain pytest
+run never pays the live round-trip. Run explicitly with:
+    pytest test_llm.py -m ""
+or directly:
+    python test_llm.py
+"""
 
 import os
+from functools import lru_cache
+
+import pytest
 from dotenv import load_dotenv
-from openai import OpenAI
 
 load_dotenv()
 
-api_key = os.getenv("OPENROUTER_API_KEY")
-base_url = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
-model = "anthropic/claude-3.5-sonnet"
+API_KEY = os.getenv("OPENROUTER_API_KEY")
+BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
+MODEL = "anthropic/claude-3.5-sonnet"
+
 
-print(f"Testing OpenRouter with:")
-print(f"Base URL: {base_url}")
-print(f"Model: {model}")
-print(f"API Key present: {bool(api_key)}")
+@lru_cache(maxsize=1)
+def _client():
+    from openai import OpenAI
 
-client = OpenAI(
-    base_url=base_url,
-    api_key=api_key,
-)
+    return OpenAI(base_url=BASE_URL, api_key=API_KEY)
 
-try:
-    response = client.chat.completions.create(
-        model=model,
+
+@pytest.mark.slow
+@pytest.mark.skipif(not API_KEY, reason="Requires OPENROUTER_API_KEY to be set")
+def test_openrouter_smoke():
+    """One live completion round-trip to verify credentials and routing."""
+    response = _client().chat.completions.create(
+        model=MODEL,
         messages=[{"role": "user", "content": "Hello"}],
     )
-    print("Success!")
-    print(response.choices[0].message.content)
-except Exception as e:
-    print(f"Error: {e}")
+    assert response.choices
+    assert response.choices[0].message.content
+
+
+if __name__ == "__main__":
+    print("Testing OpenRouter with:")
+    print(f"Base URL: {BASE_URL}")
+    print(f"Model: {MODEL}")
+    print(f"API Key present: {bool(API_KEY)}")
+    try:
+        test_openrouter_smoke()
+        print("Success!")
+    except Exception as e:
+        print(f"Error: {e}")
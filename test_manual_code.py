@@ -1,46 +1,21 @@
+"""
+Integration checks for the voice agent's run_tests tool.
+
+Needs the LiveKit stack importable, so this lives outside the default
+test paths; run explicitly with:
+    pytest test_manual_code.py -m ""
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("livekit.agents", reason="requires the LiveKit stack")
 
-import logging
-from agent.livekit_agent import InterviewerAgent
 from agent.api.routes import PROBLEM_BANK
+from agent.livekit_agent import InterviewerAgent
 
-# Mock logging
-logging.basicConfig(level=logging.INFO)
-
-def test_code_execution():
-    print("--- Testing Code Execution Logic ---")
-    
-    # 1. Setup Mock State and Problem
-    problem = PROBLEM_BANK["two_sum"]
-    state = {
-        "code_snapshot": "",
-        "problem": problem
-    }
-    
-    # 2. Instantiate Agent
-    print(f"Initializing agent for problem: {problem['title']}")
-    try:
-        agent = InterviewerAgent(problem, state)
-    except Exception as e:
-        print(f"Failed to init agent: {e}")
-        # livekit.agents.voice.Agent might need arguments?
-        # It calls super().__init__(instructions=...)
-        # Should be fine.
-        return
-
-    # 3. Test Empty Code
-    print("\nTest 1: Empty Code")
-    result = agent.run_tests()
-    print(f"Result: {result}")
-    
-    # 4. Test Incorrect Code (Starter Code)
-    print("\nTest 2: Starter Code (Should Fail)")
-    state["code_snapshot"] = problem["starter_code"]
-    result = agent.run_tests()
-    print(f"Result: {result}")
-
-    # 5. Test Correct Code
-    print("\nTest 3: Correct Code")
-    correct_solution = """
+CORRECT_SOLUTION = """
 def twoSum(nums: list[int], target: int) -> list[int]:
     seen = {}
     for i, num in enumerate(nums):
@@ -50,48 +25,69 @@ def twoSum(nums: list[int], target: int) -> list[int]:
         seen[num] = i
     return []
 """
-    state["code_snapshot"] = correct_solution
-    result = agent.run_tests()
-    print(f"Result: {result}")
 
-    # 5.5 Test Incorrect Logic (Fails Constraints)
-    print("\nTest 3.5: Incorrect Logic (Returns same element twice)")
-    incorrect_logic = """
+# Bug: does not check i != j, so it returns the same element twice
+INCORRECT_LOGIC = """
 def twoSum(nums: list[int], target: int) -> list[int]:
     for i in range(len(nums)):
         for j in range(len(nums)):
-            # Bug: Does not check if i != j
             if nums[i] + nums[j] == target:
                 return [i, j]
     return []
 """
-    state["code_snapshot"] = incorrect_logic
-    result = agent.run_tests()
-    print(f"Result: {result}")
 
-    # 5.6 Test Infinite Loop (Timeout)
-    print("\nTest 3.6: Infinite Loop (Should Timeout)")
-    infinite_loop = """
+INFINITE_LOOP = """
 def twoSum(nums: list[int], target: int) -> list[int]:
     while True:
         pass
     return []
 """
-    state["code_snapshot"] = infinite_loop
-    result = agent.run_tests()
-    print(f"Result: {result}")
-    
-    # 6. Test Data Channel Logic Mock
-    print("\nTest 4: Data Channel Logic (Mock Update)")
-    # Simulating what on_data does
-    new_snapshot = "print('Hello World')"
-    state["code_snapshot"] = new_snapshot
-    print(f"State updated to: {state['code_snapshot']}")
-    # Verify agent sees it
-    if agent.state["code_snapshot"] == new_snapshot:
-        print("Agent state synced successfully!")
-    else:
-        print("Agent state failed to sync.")
-
-if __name__ == "__main__":
-    test_code_execution()
+
+
+@pytest.fixture(scope="module")
+def problem():
+    return PROBLEM_BANK["two_sum"]
+
+
+@pytest.fixture
+def agent(problem):
+    state = {"code_snapshot": "", "problem": problem}
+    return InterviewerAgent(problem, state)
+
+
+def _run_tests(agent, code):
+    """Point the shared state at `code` and invoke the tool."""
+    agent.state["code_snapshot"] = code
+    return asyncio.run(agent.run_tests())
+
+
+def test_empty_code(agent):
+    assert _run_tests(agent, "") == "No code found in the editor."
+
+
+def test_starter_code_fails(agent, problem):
+    assert "failed" in _run_tests(agent, problem["starter_code"])
+
+
+def test_correct_solution_passes(agent):
+    result = _run_tests(agent, CORRECT_SOLUTION)
+    assert result.startswith("All")
+
+
+def test_incorrect_logic_fails(agent):
+    assert "failed" in _run_tests(agent, INCORRECT_LOGIC)
+
+
+@pytest.mark.slow
+def test_infinite_loop_times_out(agent):
+    # Terminates via the sandbox wall timeout / CPU limit, not SIGALRM
+    assert "failed" in _run_tests(agent, INFINITE_LOOP)
+
+
+def test_state_shared_with_agent(problem):
+    # The agent reads the live state dict the caller owns (the websocket
+    # layer mutates it); verify updates are visible without re-handing it
+    state = {"code_snapshot": "", "problem": problem}
+    agent = InterviewerAgent(problem, state)
+    state["code_snapshot"] = "print('Hello World')"
+    assert agent.state["code_snapshot"] == "print('Hello World')"